@@ -56,7 +56,35 @@ def get_ticklabel_extend(axis, pos, height, renderer):
         bbox = mtransforms.Bbox.union(ticklabel_boxes)
     else:
         bbox = mtransforms.Bbox.from_extents(0, 0, 0, 0)
-    return np.abs(np.diff(bbox.get_points()[:, height]))[0]
+    points = bbox.get_points()
+    return abs(points[1, height] - points[0, height])
+
+
+def _group_max(keys, values):
+    """ Maximum of values over groups of identical keys.
+
+    Parameters
+    ----------
+    keys: 2-D array of floats
+        Each row is the key of the corresponding element in `values`.
+    values: 1-D array of floats
+        The values to be maximized within each group.
+
+    Returns
+    -------
+    maxvalues: 1-D array of floats
+        For each element in `values` the maximum over all values
+        with the same key.
+    """
+    if len(values) == 0:
+        return values
+    order = np.lexsort(keys.T[::-1])
+    skeys = keys[order]
+    starts = np.concatenate(([0], np.flatnonzero(np.any(skeys[1:] != skeys[:-1], 1)) + 1))
+    gmax = np.maximum.reduceat(values[order], starts)
+    maxvalues = np.empty_like(values)
+    maxvalues[order] = np.repeat(gmax, np.diff(np.append(starts, len(skeys))))
+    return maxvalues
 
 
 def align_xlabels(fig, axs=None):
@@ -95,7 +123,7 @@ def align_xlabels(fig, axs=None):
         xax = ax.xaxis
         if xax.get_label_text():
             ax_bbox = ax.get_window_extent().get_points()
-            pixely = np.abs(np.diff(ax_bbox[:,1]))[0]
+            pixely = abs(ax_bbox[1,1] - ax_bbox[0,1])
             pos = xax.get_label_position() == 'top'
             #tlh = np.abs(np.diff(xax.get_ticklabel_extents(renderer)[pos].get_points()[:,1]))[0]
             tlh = get_ticklabel_extend(xax, pos, 1, renderer)
@@ -109,9 +137,7 @@ def align_xlabels(fig, axs=None):
             ylx[k] = xax.get_label().get_position()[0]
             yap[k,:] = (ax_bbox[0,1], xax.get_label().get_rotation(), pos)
     # compute label position for axes with same position:
-    for yp in set(zip(yap[:,0], yap[:,1], yap[:,2])):
-        idx = np.all(yap == yp, 1)
-        ylh[idx] = np.max(ylh[idx])
+    ylh = _group_max(yap, ylh)
     # set label position:
     for k, ax in enumerate(fig.get_axes()):
         if yap[k, 0] > 0:
@@ -157,7 +183,7 @@ def align_ylabels(fig, axs=None):
         yax = ax.yaxis
         if yax.get_label_text():
             ax_bbox = ax.get_window_extent().get_points()
-            pixelx = np.abs(np.diff(ax_bbox[:,0]))[0]
+            pixelx = abs(ax_bbox[1,0] - ax_bbox[0,0])
             pos = yax.get_label_position() == 'right'
             #tlw = np.abs(np.diff(yax.get_ticklabel_extents(renderer)[pos].get_points()[:,0]))[0]
             tlw = get_ticklabel_extend(yax, pos, 0, renderer)
@@ -171,9 +197,7 @@ def align_ylabels(fig, axs=None):
             xly[k] = yax.get_label().get_position()[1]
             xap[k,:] = (ax_bbox[0,0], yax.get_label().get_rotation(), pos)
     # compute label position for axes with same position:
-    for xp in set(zip(xap[:,0], xap[:,1], xap[:,2])):
-        idx = np.all(xap == xp, 1)
-        xlw[idx] = np.max(xlw[idx])
+    xlw = _group_max(xap, xlw)
     # set label position:
     for k, ax in enumerate(fig.get_axes()):
         if xap[k, 0] > 0:
@@ -206,8 +230,10 @@ def align_labels(fig, axs=None):
 def __align_xlabels(fig, axs=None):
     """ Select align_xlabels() function from matplotlib or plottools.
     """
-    if (hasattr(fig, '__align_overwritex') and fig.__align_overwritex) or \
-       (not hasattr(fig, '__align_overwritex') and  mpl.rcParams['align.overwritex']):
+    overwrite = getattr(fig, '__align_overwritex', None)
+    if overwrite is None:
+        overwrite = mpl.rcParams['align.overwritex']
+    if overwrite:
         fig.__align_xlabels(axs)
     else:
         fig.__align_xlabels_orig_align(axs)
@@ -216,8 +242,10 @@ def __align_xlabels(fig, axs=None):
 def __align_ylabels(fig, axs=None):
     """ Select align_ylabels() function from matplotlib or plottools.
     """
-    if (hasattr(fig, '__align_overwritey') and fig.__align_overwritey) or \
-       (not hasattr(fig, '__align_overwritey') and  mpl.rcParams['align.overwritey']):
+    overwrite = getattr(fig, '__align_overwritey', None)
+    if overwrite is None:
+        overwrite = mpl.rcParams['align.overwritey']
+    if overwrite:
         fig.__align_ylabels(axs)
     else:
         fig.__align_ylabels_orig_align(axs)
@@ -260,19 +288,6 @@ def __plt_show_labels(*args, **kwargs):
     plt.__show_orig_align(*args, **kwargs)
 
 
-def __plt_savefig_labels(*args, **kwargs):
-    """ Call `align_labels()` on the current figure before saving it.
-    """
-    fig = plt.gcf()
-    if (hasattr(fig, '__align_autox') and fig.__align_autox) or \
-       (not hasattr(fig, '__align_autox') and  mpl.rcParams['align.autox']):
-        fig.align_xlabels()
-    if (hasattr(fig, '__align_autoy') and fig.__align_autoy) or \
-       (not hasattr(fig, '__align_autoy') and  mpl.rcParams['align.autoy']):
-        fig.align_ylabels()
-    plt.__savefig_orig_align(*args, **kwargs)
-
-    
 def set_align(fig, autox=None, autoy='same', overwritex=None, overwritey='same'):
     """ Modify align behavior of figure.
                   
@@ -390,9 +405,6 @@ def install_align():
     if not hasattr(mpl.figure.Figure, '__show_orig_align'):
         mpl.figure.Figure.__show_orig_align = mpl.figure.Figure.show
         mpl.figure.Figure.show = __fig_show_labels
-    if not hasattr(plt, '__savefig_orig_align'):
-        plt.__savefig_orig_align = plt.savefig
-        plt.savefig = __plt_savefig_labels
     if not hasattr(plt, '__show_orig_align'):
         plt.__show_orig_align = plt.show
         plt.show = __plt_show_labels
@@ -438,9 +450,6 @@ def uninstall_align():
     if hasattr(mpl.figure.Figure, '__show_orig_align'):
         mpl.figure.Figure.show = mpl.figure.Figure.__show_orig_align
         delattr(mpl.figure.Figure, '__show_orig_align')
-    if hasattr(plt, '__savefig_orig_align'):
-        plt.savefig = plt.__savefig_orig_align
-        delattr(plt, '__savefig_orig_align')
     if hasattr(plt, '__show_orig_align'):
         plt.show = plt.__show_orig_align
         delattr(plt, '__show_orig_align')
@@ -6,9 +6,16 @@ Drawing arrows.
 
 - `harrow()`: draw a horizontal arrow with annotation on the arrow. 
 - `varrow()`: draw a vertical arrow with annotation on the arrow. 
+- `harrows()`: draw many horizontal arrows at once.
+- `varrows()`: draw many vertical arrows at once.
 - `point_to()`: text with arrow pointing to a point.
 
 
+## Batches of arrows
+
+- `arrow_batch()`: context for drawing many arrows without intermediate redraws.
+
+
 ## Settings
 
 - `arrow_style()`: generate an arrow style.
@@ -30,10 +37,286 @@ module, `install_arrows()` is called automatically.
 """
 
 import __main__
+from functools import lru_cache
+from contextlib import contextmanager
 import numpy as np
 import matplotlib as mpl
 import matplotlib.pyplot as plt
-from matplotlib.patches import ArrowStyle
+import matplotlib.transforms as mtransforms
+from matplotlib.path import Path
+from matplotlib.lines import Line2D
+from matplotlib.patches import ArrowStyle, ConnectionStyle, FancyArrowPatch
+from matplotlib.collections import LineCollection, PathCollection
+
+
+# canonical names of the values for the heads arguments:
+_heads_map = {'left': 'left', '<': 'left', 'right': 'right', '>': 'right',
+              'both': 'both', '<>': 'both', 'none': 'none', '': 'none'}
+
+# arrow heads pointing backwards:
+_back_styles = {'>': '<', '|>': '<|', '>>': '<<', '|': '|'}
+
+
+def _is_template(text):
+    """ True if text contains a formatting instruction for the arrow length.
+
+    A trailing '%' is taken literally.
+    """
+    return '%' in text and not text.endswith('%')
+
+
+def _trim_lines(ax, transform, starts, ends, trim_starts, trim_ends):
+    """ Shorten lines on the display.
+
+    Parameters
+    ----------
+    ax: matplotlib axes
+        Axes on which the lines are drawn.
+    transform: matplotlib.Transform
+        Coordinate system of the lines.
+    starts: 2-D array of floats
+        For each line the x- and y-coordinate of its starting point.
+    ends: 2-D array of floats
+        For each line the x- and y-coordinate of its end point.
+    trim_starts: float or array of floats
+        Shorten the lines at their starting points by this many points.
+    trim_ends: float or array of floats
+        Shorten the lines at their end points by this many points.
+
+    Returns
+    -------
+    segments: 3-D array of floats
+        For each line the coordinates of the starting and end point
+        of the shortened line.
+    angles: array of floats
+        For each line its direction on the display in radians.
+    """
+    p0 = transform.transform(starts)
+    p1 = transform.transform(ends)
+    direction = p1 - p0
+    norm = np.hypot(direction[:,0], direction[:,1])
+    norm[norm == 0] = 1
+    direction /= norm[:,np.newaxis]
+    angles = np.arctan2(direction[:,1], direction[:,0])
+    scale = ax.get_figure().dpi/72
+    p0 += scale*np.reshape(trim_starts, (-1, 1))*direction
+    p1 -= scale*np.reshape(trim_ends, (-1, 1))*direction
+    inverse = transform.inverted()
+    segments = np.stack((inverse.transform(p0), inverse.transform(p1)), 1)
+    return segments, angles
+
+
+def _freeze_limits(ax):
+    """ Fix the current limits of an axes by turning off autoscaling.
+
+    Nothing is done if autoscaling is already off.
+
+    Parameters
+    ----------
+    ax: matplotlib axes
+        The axes.
+    """
+    if ax.get_autoscalex_on() or ax.get_autoscaley_on():
+        ax.autoscale_view(False)
+        ax.autoscale(False)
+
+
+def _line_arrowstyle(heads, style):
+    """ Arrow style string for line, filled, and bar arrows.
+
+    Parameters
+    ----------
+    heads: string
+        One of 'left', 'right', 'both', or 'none'.
+    style: string
+        Appearance of the arrow head:
+        '>': line arrow, '|>': filled arrow, '|': bar
+
+    Returns
+    -------
+    arrowstyle: string
+        The matplotlib arrow style, e.g. '<|-|>'.
+    """
+    bstyle = _back_styles[style]
+    arrowstyle = '-'
+    if heads == 'right':
+        arrowstyle = '-' + style
+    elif heads == 'left':
+        arrowstyle = bstyle + '-'
+    elif heads == 'both':
+        arrowstyle = bstyle + '-' + style
+    return arrowstyle
+
+
+# matplotlib arrow styles of line, filled, and bar arrows for all heads:
+_line_arrowstyles = {(heads, style): _line_arrowstyle(heads, style)
+                     for heads in ['left', 'right', 'both', 'none']
+                     for style in ['>', '|>', '|']}
+
+
+class _FancyBoth(ArrowStyle.Fancy):
+    """ Fancy arrow style with heads on both ends.
+
+    The path of the patch is composed of two fancy arrows pointing into
+    opposite directions.
+    """
+
+    def transmute(self, path, mutation_size, linewidth):
+        head_path, fillable = super().transmute(path, mutation_size, linewidth)
+        back_path = Path(path.vertices[::-1], path.codes)
+        tail_path, _ = super().transmute(back_path, mutation_size, linewidth)
+        return Path.make_compound_path(head_path, tail_path), fillable
+
+
+@lru_cache(maxsize=64)
+def _fancy_style(head_length, head_width, tail_width=0.01, both=False):
+    """ Fancy arrow style.
+
+    Arrow styles do not carry any state specific to an arrow, so the
+    same instance can be shared by all arrows with the same head and
+    tail sizes.
+
+    Parameters
+    ----------
+    head_length: float
+        Length of the arrow head relative to the mutation scale.
+    head_width: float
+        Width of the arrow head relative to the mutation scale.
+    tail_width: float
+        Width of the arrow tail relative to the mutation scale.
+    both: bool
+        If True, draw heads on both ends of the arrow.
+
+    Returns
+    -------
+    arrowstyle: matplotlib.patches.ArrowStyle
+        The fancy arrow style.
+    """
+    fancy = _FancyBoth if both else ArrowStyle.Fancy
+    return fancy(head_length=head_length, head_width=head_width,
+                 tail_width=tail_width)
+
+
+@lru_cache(maxsize=32)
+def _arc3_style(radius):
+    """ Arc connection style for `point_to()`.
+
+    Parameters
+    ----------
+    radius: float
+        Radius of the arc relative to the length of the connection.
+
+    Returns
+    -------
+    connectionstyle: matplotlib.patches.ConnectionStyle
+        The arc connection style.
+    """
+    return ConnectionStyle.Arc3(rad=radius)
+
+
+def _arrow(ax, x, y, d, horizontal, heads, text, side, dist, style,
+           shrink, lw, color, head_width, head_length, transform, kwargs):
+    """ Draw a horizontal or vertical arrow with annotation on the arrow.
+
+    Shared implementation of `harrow()` and `varrow()`.
+
+    Parameters
+    ----------
+    d: float
+        Length of the arrow along the x-axis if `horizontal`,
+        along the y-axis otherwise.
+    horizontal: bool
+        Draw a horizontal arrow like `harrow()` or a vertical one
+        like `varrow()`.
+    side: string
+        The `va` argument of `harrow()` or the `ha` argument of `varrow()`.
+    kwargs: dict
+        Formatting of the annotation text.
+
+    All other parameters are the ones of `harrow()` and `varrow()`.
+    """
+    if transform is None:
+        transform = ax.transData
+    zkwargs = {}
+    if 'zorder' in kwargs:
+        zkwargs.update(dict(zorder=kwargs['zorder']))
+    # zorder of the arrow patch defaults to the one of annotations:
+    azorder = kwargs.get('zorder', 3)
+    heads = _heads_map[heads]
+    if heads == 'none':
+        style = '>'
+    xy0 = (x, y)
+    xy1 = (x+d, y) if horizontal else (x, y+d)
+    if style == '>>':
+        arrowstyle = _fancy_style(0.07*head_length, 0.07*head_width,
+                                  both=(heads == 'both'))
+        xyfrom, xyto = xy0, xy1
+        if heads == 'left':
+            xyfrom, xyto = xyto, xyfrom
+        arrow = FancyArrowPatch(xyfrom, xyto, arrowstyle=arrowstyle,
+                                mutation_scale=mpl.rcParams['font.size'],
+                                edgecolor='none', facecolor=color,
+                                linewidth=lw if horizontal else 0,
+                                shrinkA=shrink, shrinkB=shrink,
+                                transform=transform, clip_on=False,
+                                zorder=azorder)
+    else:
+        scale = head_width*2.0
+        if style == '|':
+            scale /= 4.0
+        arrowstyle = _line_arrowstyles[(heads, style)]
+        ec = color
+        lww = lw
+        if style == '|>':
+            ec = 'none'
+            lww = 0
+        arrow = FancyArrowPatch(xy0, xy1, arrowstyle=arrowstyle,
+                                mutation_scale=scale,
+                                edgecolor=ec, facecolor=color,
+                                linewidth=lww, shrinkA=shrink, shrinkB=shrink,
+                                transform=transform, clip_on=False,
+                                zorder=azorder)
+    ax.add_artist(arrow)
+    if style in ['|>', '>>']:
+        if transform.contains_branch(ax.transData):
+            # include the line in the limits before shortening it:
+            to_data = transform - ax.transData
+            ax.update_datalim(to_data.transform([xy0, xy1]))
+            ax.autoscale_view()
+        dd = 0.5*head_length
+        ddr = dd if heads in ['right', 'both'] else 0
+        ddl = dd if heads in ['left', 'both'] else 0
+        segments, _ = _trim_lines(ax, transform, [xy0], [xy1], ddl, ddr)
+        ax.add_line(Line2D(segments[0,:,0], segments[0,:,1], linestyle='-',
+                           lw=lw, color=color, transform=transform,
+                           solid_capstyle='butt', clip_on=False, **zkwargs))
+    if text:
+        if _is_template(text):
+            text = text % d
+        # the text is offset in points, but the line below filled heads
+        # is shortened in data coordinates, so keep the limits fixed:
+        _freeze_limits(ax)
+        dt = 0.5*lw + dist
+        if 'ha' in kwargs:
+            del kwargs['ha']
+        if horizontal:
+            xt, yt = x+0.5*d, y
+            if side == 'top':
+                dx, dy, ha, va = 0, dt, 'center', 'bottom'
+            else:
+                dx, dy, ha, va = 0, -dt, 'center', 'top'
+        else:
+            if 'va' in kwargs:
+                del kwargs['va']
+            xt, yt = x, y+0.5*d
+            if side == 'right':
+                dx, dy, ha, va = dt, 0, 'left', 'center'
+            else:
+                dx, dy, ha, va = -dt, 0, 'right', 'center'
+        trans = mtransforms.offset_copy(transform, fig=ax.get_figure(),
+                                        x=dx, y=dy, units='points')
+        ax.text(xt, yt, text, ha=ha, va=va, transform=trans, clip_on=False,
+                **kwargs)
 
 
 def harrow(ax, x, y, dx, heads='right', text=None, va='bottom', dist=3.0,
@@ -57,7 +340,8 @@ def harrow(ax, x, y, dx, heads='right', text=None, va='bottom', dist=3.0,
         at the end ('right', '>'), on both ends ('both', '<>'), or none ('none', '').
     text: string
         Text for annotating the arrow. A formatting instruction within text (e.g. 'd=%.1fm')
-        is replaced by `dx`.
+        is replaced by `dx`. If a text is given, autoscaling of the axes is
+        turned off.
     va: string
         Place text annotation above ('top') or below ('bottom') the arrow.
     dist: float
@@ -85,93 +369,8 @@ def harrow(ax, x, y, dx, heads='right', text=None, va='bottom', dist=3.0,
     --------
     varrow(), point_to(), arrow_style()
     """
-    if transform is None:
-        transform = ax.transData
-    transcoord = 'data'
-    if transform is ax.transAxes:
-        transcoord = 'axes fraction'
-    if transform is ax.get_figure().transFigure:
-        transcoord = 'figure fraction'
-    zkwargs = {}
-    if 'zorder' in kwargs:
-        zkwargs.update(dict(zorder=kwargs['zorder']))
-    heads_d = {'leftx': 'left', '<x': 'left', 'rightx': 'right', '>x': 'right',
-               'bothx': 'both', '<>x': 'both', 'nonex': 'none', 'x': 'none'}
-    heads = heads_d[heads+'x']
-    if heads == 'none':
-        style = '>'
-    if style == '>>':
-        arrowstyle = ArrowStyle.Fancy(head_length=0.07*head_length,
-                                      head_width=0.07*head_width, tail_width=0.01)
-        if heads in ['right', 'both']:
-            ax.annotate('', (x+dx, y), (x, y),
-                        xycoords=transcoord, textcoords=transcoord,
-                        arrowprops=dict(arrowstyle=arrowstyle,
-                                        edgecolor='none', facecolor=color,
-                                        linewidth=lw, shrinkA=shrink, shrinkB=shrink,
-                                        clip_on=False), annotation_clip=False, **zkwargs)
-        if heads in ['left', 'both']:
-            ax.annotate('', (x, y), (x+dx, y),
-                        xycoords=transcoord, textcoords=transcoord,
-                        arrowprops=dict(arrowstyle=arrowstyle,
-                                        edgecolor='none', facecolor=color,
-                                        linewidth=lw, shrinkA=shrink, shrinkB=shrink,
-                                        clip_on=False), annotation_clip=False, **zkwargs)
-    else:
-        scale = head_width*2.0
-        if style == '|':
-            scale /= 4.0
-        bstyle = style[::-1]
-        if bstyle[0] == '>':
-            bstyle = '<' + bstyle[1:]
-        arrowstyle = '-'
-        if heads == 'right':
-            arrowstyle = '-' + style
-        elif heads == 'left':
-            arrowstyle = bstyle + '-'
-        elif heads == 'both':
-            arrowstyle = bstyle + '-' + style
-        ec = color
-        lww = lw
-        if style == '|>':
-            ec = 'none'
-            lww = 0
-        ax.annotate('', (x+dx, y), (x, y),
-                    xycoords=transcoord, textcoords=transcoord,
-                    arrowprops=dict(arrowstyle=arrowstyle, edgecolor=ec, facecolor=color,
-                                    linewidth=lww, shrinkA=shrink, shrinkB=shrink,
-                                    mutation_scale=scale, clip_on=False),
-                    annotation_clip=False, **zkwargs)
-    if style in ['|>', '>>']:
-        pixelx = np.abs(np.diff(ax.get_window_extent().get_points()[:,0]))[0]
-        xmin, xmax = ax.get_xlim()
-        dxu = np.abs(xmax - xmin)/pixelx
-        ddx = 0.5*head_length*dxu
-        ddxr = ddx if heads in ['right', 'both'] else 0
-        ddxl = ddx if heads in ['left', 'both'] else 0
-        if dx < 0:
-            ddxl = -ddxl
-            ddxr = -ddxr
-        ax.plot([x+ddxl, x+dx-ddxr], [y, y], '-', lw=lw, color=color,
-                transform=transform, solid_capstyle='butt', clip_on=False, **zkwargs)
-    if text:
-        if '%' in text and text[-1] != '%':
-            text = text % dx
-        # ax dimensions:
-        ax.autoscale_view(False)
-        ax.autoscale(False)
-        pixely = np.abs(np.diff(ax.get_window_extent().get_points()[:,1]))[0]
-        ymin, ymax = ax.get_ylim()
-        dyu = np.abs(ymax - ymin)/pixely
-        dy = 0.5*lw + dist
-        if 'ha' in kwargs:
-            del kwargs['ha']
-        if va == 'top':
-            ax.text(x+0.5*dx, y+dy*dyu, text, ha='center', va='bottom',
-                    transform=transform, clip_on=False, **kwargs)
-        else:
-            ax.text(x+0.5*dx, y-dy*dyu, text, ha='center', va='top',
-                    transform=transform, clip_on=False, **kwargs)
+    _arrow(ax, x, y, dx, True, heads, text, va, dist, style, shrink, lw,
+           color, head_width, head_length, transform, kwargs)
 
 
 def varrow(ax, x, y, dy, heads='right', text=None, ha='right', dist=3.0,
@@ -195,7 +394,8 @@ def varrow(ax, x, y, dy, heads='right', text=None, ha='right', dist=3.0,
         at the end ('right', '>'), on both ends ('both', '<>'), or none ('none', '').
     text: string
         Text for annotating the arrow. A formatting instruction within text (e.g. 'd=%.1fm')
-        is replaced by `dy`.
+        is replaced by `dy`. If a text is given, autoscaling of the axes is
+        turned off.
     ha: string
         Place text annotation to the left ('left') or right ('right') of the arrow.
     dist: float
@@ -223,98 +423,277 @@ def varrow(ax, x, y, dy, heads='right', text=None, ha='right', dist=3.0,
     --------
     harrow(), point_to(), arrow_style()
     """
+    _arrow(ax, x, y, dy, False, heads, text, ha, dist, style, shrink, lw,
+           color, head_width, head_length, transform, kwargs)
+
+
+@lru_cache(maxsize=32)
+def _head_path(style, head_width, head_length, angle):
+    """ Path of an arrow head for `harrows()` and `varrows()`.
+
+    Parameters
+    ----------
+    style: string
+        Appearance of the arrow head:
+        '>': line arrow, '|>': filled arrow, '>>': fancy arrow, '|': bar
+    head_width: float
+        Width of arrow head in points.
+    head_length: float
+        Length of arrow head in points.
+    angle: float
+        Direction into which the arrow head points in radians.
+
+    Returns
+    -------
+    path: matplotlib.path.Path
+        The arrow head in points with its tip at the origin.
+    """
+    if style == '|':
+        w = 0.5*head_width
+        path = Path([(0, -w), (0, w)])
+    elif style == '>>':
+        l = 0.7*head_length
+        w = 0.35*head_width
+        path = Path([(-l, w), (0, 0), (-l, -w), (-l, w)], closed=True)
+    else:
+        l = 0.8*head_width
+        w = 0.4*head_width
+        path = Path([(-l, w), (0, 0), (-l, -w), (-l, w)], closed=(style == '|>'))
+        if style == '>':
+            path = Path(path.vertices[:3])
+    return mtransforms.Affine2D().rotate(angle).transform_path(path)
+
+
+def _arrows(ax, x, y, d, horizontal, heads, text, textpos, dist, style,
+            shrink, lw, color, head_width, head_length, transform, kwargs):
+    """ Draw many horizontal or vertical arrows at once.
+
+    See `harrows()` and `varrows()` for the parameter.
+    """
     if transform is None:
         transform = ax.transData
-    transcoord = 'data'
-    if transform is ax.transAxes:
-        transcoord = 'axes fraction'
-    if transform is ax.get_figure().transFigure:
-        transcoord = 'figure fraction'
+    heads = np.array([_heads_map[h] for h in np.atleast_1d(heads)])
+    x, y, d, heads = np.broadcast_arrays(np.asarray(x, dtype=float),
+                                         np.asarray(y, dtype=float),
+                                         np.asarray(d, dtype=float), heads)
+    x = x.ravel()
+    y = y.ravel()
+    d = d.ravel()
+    heads = heads.ravel()
+    if text is not None and not isinstance(text, str) and len(text) != len(d):
+        raise ValueError('number of texts (%d) does not match number of arrows (%d)'
+                         % (len(text), len(d)))
+    right = (heads == 'right') | (heads == 'both')
+    left = (heads == 'left') | (heads == 'both')
+    if horizontal:
+        starts = np.column_stack((x, y))
+        ends = np.column_stack((x + d, y))
+    else:
+        starts = np.column_stack((x, y))
+        ends = np.column_stack((x, y + d))
+    # data limits, like the lines of single filled arrows:
+    filled = style in ['|>', '>>']
+    if filled and len(d) > 0 and transform.contains_branch(ax.transData):
+        to_data = transform - ax.transData
+        ax.update_datalim(to_data.transform(np.vstack((starts, ends))))
+        ax.autoscale_view()
+    if text is not None:
+        _freeze_limits(ax)
+    if shrink:
+        segments, _ = _trim_lines(ax, transform, starts, ends, shrink, shrink)
+        starts = segments[:,0]
+        ends = segments[:,1]
+    # stems, shortened below filled heads:
+    trim = 0.5*head_length if filled else 0.0
+    segments, angles = _trim_lines(ax, transform, starts, ends,
+                                   np.where(left, trim, 0.0),
+                                   np.where(right, trim, 0.0))
     zkwargs = {}
     if 'zorder' in kwargs:
         zkwargs.update(dict(zorder=kwargs['zorder']))
-    heads_d = {'leftx': 'left', '<x': 'left', 'rightx': 'right', '>x': 'right',
-               'bothx': 'both', '<>x': 'both', 'nonex': 'none', 'x': 'none'}
-    heads = heads_d[heads+'x']
-    if heads == 'none':
-        style = '>'
-    if style == '>>':
-        arrowstyle = ArrowStyle.Fancy(head_length=0.07*head_length,
-                                      head_width=0.07*head_width,
-                                      tail_width=0.01)
-        if heads in ['right', 'both']:
-            ax.annotate('', (x, y+dy), (x, y),
-                        xycoords=transcoord, textcoords=transcoord,
-                        arrowprops=dict(arrowstyle=arrowstyle,
-                                        edgecolor='none', facecolor=color,
-                                        linewidth=0, shrinkA=shrink,
-                                        shrinkB=shrink, clip_on=False),
-                        annotation_clip=False, **zkwargs)
-        if heads in ['left', 'both']:
-            ax.annotate('', (x, y), (x, y+dy),
-                        xycoords=transcoord, textcoords=transcoord,
-                        arrowprops=dict(arrowstyle=arrowstyle,
-                                        edgecolor='none', facecolor=color,
-                                        linewidth=0, shrinkA=shrink,
-                                        shrinkB=shrink, clip_on=False),
-                        annotation_clip=False, **zkwargs)
-    else:
-        scale = head_width*2.0
-        if style == '|':
-            scale /= 4.0
-        bstyle = style[::-1]
-        if bstyle[0] == '>':
-            bstyle = '<' + bstyle[1:]
-        arrowstyle = '-'
-        if heads == 'right':
-            arrowstyle = '-' + style
-        elif heads == 'left':
-            arrowstyle = bstyle + '-'
-        elif heads == 'both':
-            arrowstyle = bstyle + '-' + style
-        ec = color
-        lww = lw
-        if style == '|>':
-            ec = 'none'
-            lww = 0
-        ax.annotate('', (x, y+dy), (x, y),
-                    xycoords=transcoord, textcoords=transcoord,
-                    arrowprops=dict(arrowstyle=arrowstyle, edgecolor=ec, facecolor=color,
-                                    linewidth=lww, shrinkA=shrink, shrinkB=shrink,
-                                    mutation_scale=scale, clip_on=False),
-                                    annotation_clip=False, **zkwargs)
-    if style in ['|>', '>>']:
-        pixely = np.abs(np.diff(ax.get_window_extent().get_points()[:,1]))[0]
-        ymin, ymax = ax.get_ylim()
-        dyu = np.abs(ymax - ymin)/pixely
-        ddy = 0.5*head_length*dyu
-        ddyr = ddy if heads in ['right', 'both'] else 0
-        ddyl = ddy if heads in ['left', 'both'] else 0
-        if dy < 0:
-            ddyl = -ddyl
-            ddyr = -ddyr
-        ax.plot([x, x], [y+ddyl, y+dy-ddyr], '-', lw=lw, color=color,
-                transform=transform, solid_capstyle='butt', clip_on=False, **zkwargs)
-    if text:
-        if '%' in text and text[-1] != '%':
-            text = text % dy
-        # ax dimensions:
-        ax.autoscale_view(False)
-        ax.autoscale(False)
-        pixelx = np.abs(np.diff(ax.get_window_extent().get_points()[:,0]))[0]
-        xmin, xmax = ax.get_xlim()
-        dxu = np.abs(xmax - xmin)/pixelx
-        dx = 0.5*lw + dist
-        if 'ha' in kwargs:
-            del kwargs['ha']
-        if 'va' in kwargs:
-            del kwargs['va']
-        if ha == 'right':
-            ax.text(x+dx*dxu, y+0.5*dy, text, ha='left', va='center',
-                    transform=transform, clip_on=False, **kwargs)
+    stems = LineCollection(segments, linewidths=lw, colors=[color],
+                           capstyle='butt', transform=transform,
+                           clip_on=False, **zkwargs)
+    ax.add_collection(stems, autolim=False)
+    # heads:
+    paths = [_head_path(style, head_width, head_length, a)
+             for a in angles[right]]
+    paths.extend(_head_path(style, head_width, head_length, a + np.pi)
+                 for a in angles[left])
+    if paths:
+        headc = PathCollection(paths, sizes=[1.0],
+                               facecolors=[color] if filled else 'none',
+                               edgecolors='none' if filled else [color],
+                               linewidths=0 if filled else lw,
+                               offsets=np.vstack((ends[right], starts[left])),
+                               offset_transform=transform,
+                               clip_on=False, **zkwargs)
+        headc.set_transform(mtransforms.IdentityTransform())
+        ax.add_collection(headc, autolim=False)
+    # annotations:
+    if text is None:
+        return
+    if isinstance(text, str):
+        if _is_template(text):
+            text = [text % dk for dk in d]
         else:
-            ax.text(x-dx*dxu, y+0.5*dy, text, ha='right', va='center',
-                    transform=transform, clip_on=False, **kwargs)
+            text = [text]*len(d)
+    else:
+        text = [tk % dk if tk and _is_template(tk) else tk
+                for tk, dk in zip(text, d)]
+    kwargs.pop('ha', None)
+    kwargs.pop('va', None)
+    dd = 0.5*lw + dist
+    fig = ax.get_figure()
+    if horizontal:
+        above = textpos == 'top'
+        trans = mtransforms.offset_copy(transform, fig=fig, x=0,
+                                        y=dd if above else -dd, units='points')
+        tkwargs = dict(ha='center', va='bottom' if above else 'top')
+    else:
+        text_right = textpos == 'right'
+        trans = mtransforms.offset_copy(transform, fig=fig,
+                                        x=dd if text_right else -dd,
+                                        y=0, units='points')
+        tkwargs = dict(ha='left' if text_right else 'right', va='center')
+    centers = 0.5*(starts + ends)
+    for (xc, yc), tk in zip(centers.tolist(), text):
+        if not tk:
+            continue
+        ax.text(xc, yc, tk, transform=trans, clip_on=False,
+                **tkwargs, **kwargs)
+
+
+def harrows(ax, x, y, dx, heads='right', text=None, va='bottom', dist=3.0,
+            style='>', shrink=0, lw=1, color='k',
+            head_width=15, head_length=15, transform=None, **kwargs):
+    """ Draw many horizontal arrows at once.
+
+    All arrows share the same style. The lines of the arrows are drawn
+    as a single line collection and the arrow heads as a single path
+    collection. This is much faster than calling `harrow()` for each
+    arrow.
+           
+    Parameters
+    ----------
+    ax: matplotlib axes
+        Axes on which to draw the arrows.
+    x: float or array of floats
+        X-coordinates of starting points of arrows.
+    y: float or array of floats
+        Y-coordinates of starting points of arrows.
+    dx: float or array of floats
+        Lengths of arrows in x-coordinates.
+    heads: string or list of strings
+        One of 'left', '<', 'right', '>', 'both', '<>', 'none', or '',
+        Specifies whether to draw the arrow heads at the starting points ('left', '<'),
+        at the ends ('right', '>'), on both ends ('both', '<>'), or none ('none', '').
+        A list specifies the heads for each arrow.
+    text: string or list of strings
+        Texts for annotating the arrows. A formatting instruction within a text
+        (e.g. 'd=%.1fm') is replaced by the arrow's `dx`.
+        A list needs one text for each arrow.
+        If texts are given, autoscaling of the axes is turned off.
+    va: string
+        Place text annotations above ('top') or below ('bottom') the arrows.
+    dist: float
+        Distance of text annotations from arrows in points.
+    style: string
+        Appearance of the arrow heads:
+        '>': line arrow, '|>': filled arrow, '>>': fancy arrow, '|': bar
+    shrink: float
+        Shrink arrows away from endpoints in points.
+    lw: float
+        Linewidth of lines in points.
+    color: matplotlib color
+        Color of lines and arrows.
+    head_width: float
+        Width of arrow heads in points.
+    head_length: float
+        Length of arrow heads in points.
+    transform: matplotlib.Transform
+        Defines coordinate system for `x`, `y`, and `dx`. Defaults to data coordinates.
+    **kwargs: key-word arguments
+        Formatting of the annotation texts, passed on to text().
+        A `zorder` argument is also applied to the arrows.
+
+    Raises
+    ------
+    ValueError:
+        Number of texts does not match number of arrows.
+
+    See Also
+    --------
+    harrow(), varrows()
+    """
+    _arrows(ax, x, y, dx, True, heads, text, va, dist, style, shrink, lw,
+            color, head_width, head_length, transform, kwargs)
+
+
+def varrows(ax, x, y, dy, heads='right', text=None, ha='right', dist=3.0,
+            style='>', shrink=0, lw=1, color='k',
+            head_width=15, head_length=15, transform=None, **kwargs):
+    """ Draw many vertical arrows at once.
+
+    All arrows share the same style. The lines of the arrows are drawn
+    as a single line collection and the arrow heads as a single path
+    collection. This is much faster than calling `varrow()` for each
+    arrow.
+           
+    Parameters
+    ----------
+    ax: matplotlib axes
+        Axes on which to draw the arrows.
+    x: float or array of floats
+        X-coordinates of starting points of arrows.
+    y: float or array of floats
+        Y-coordinates of starting points of arrows.
+    dy: float or array of floats
+        Lengths of arrows in y-coordinates.
+    heads: string or list of strings
+        One of 'left', '<', 'right', '>', 'both', '<>', 'none', or '',
+        Specifies whether to draw the arrow heads at the starting points ('left', '<'),
+        at the ends ('right', '>'), on both ends ('both', '<>'), or none ('none', '').
+        A list specifies the heads for each arrow.
+    text: string or list of strings
+        Texts for annotating the arrows. A formatting instruction within a text
+        (e.g. 'd=%.1fm') is replaced by the arrow's `dy`.
+        A list needs one text for each arrow.
+        If texts are given, autoscaling of the axes is turned off.
+    ha: string
+        Place text annotations to the left ('left') or right ('right') of the arrows.
+    dist: float
+        Distance of text annotations from arrows in points.
+    style: string
+        Appearance of the arrow heads:
+        '>': line arrow, '|>': filled arrow, '>>': fancy arrow, '|': bar
+    shrink: float
+        Shrink arrows away from endpoints in points.
+    lw: float
+        Linewidth of lines in points.
+    color: matplotlib color
+        Color of lines and arrows.
+    head_width: float
+        Width of arrow heads in points.
+    head_length: float
+        Length of arrow heads in points.
+    transform: matplotlib.Transform
+        Defines coordinate system for `x`, `y`, and `dy`. Defaults to data coordinates.
+    **kwargs: key-word arguments
+        Formatting of the annotation texts, passed on to text().
+        A `zorder` argument is also applied to the arrows.
+
+    Raises
+    ------
+    ValueError:
+        Number of texts does not match number of arrows.
+
+    See Also
+    --------
+    varrow(), harrows()
+    """
+    _arrows(ax, x, y, dy, False, heads, text, ha, dist, style, shrink, lw,
+            color, head_width, head_length, transform, kwargs)
 
 
 def point_to(ax, text, xyfrom, xyto, radius=0.2, relpos=(1, 0.5),
@@ -360,35 +739,34 @@ def point_to(ax, text, xyfrom, xyto, radius=0.2, relpos=(1, 0.5),
     --------
     harrow(), varrow(), arrow_style()
     """
-    heads_d = {'leftx': 'left', '<x': 'left', 'rightx': 'right', '>x': 'right',
-               'bothx': 'both', '<>x': 'both', 'nonex': 'none', 'x': 'none'}
-    heads = heads_d[heads+'x']
+    heads = _heads_map[heads]
     if heads == 'none':
         style = '>'
     if heads == 'both' and style == '>>':
         style = '|>'
-    back_styles = {'>': '<', '|>': '<|', '>>': '<<'}
-    bstyle = back_styles[style]
+    bstyle = _back_styles[style]
     astyle = ''
     if heads in ['left', 'both']:
         astyle += bstyle
     astyle += '-'
     if heads in ['right', 'both']:
         astyle += style
+    arrowprops = dict(facecolor=color, relpos=relpos,
+                      shrinkA=shrink, shrinkB=shrink, clip_on=False,
+                      connectionstyle=_arc3_style(radius))
     if style == '>>':
-        arrowstyle = ArrowStyle.Fancy(head_length=0.09*head_length,
-                                      head_width=0.09*head_width,
-                                      tail_width=0.14*lw)
-        arrowprops = dict(arrowstyle=arrowstyle, edgecolor='none', linewidth=0)
+        arrowprops['arrowstyle'] = _fancy_style(0.09*head_length,
+                                                0.09*head_width, 0.14*lw)
+        arrowprops['edgecolor'] = 'none'
+        arrowprops['linewidth'] = 0
     else:
         scale = head_width*2.0
         if style == '|':
             scale /= 4.0
-        arrowprops = dict(arrowstyle=astyle, edgecolor=color,
-                          mutation_scale=scale, linewidth=lw)
-    arrowprops.update(dict(facecolor=color, relpos=relpos,
-                           shrinkA=shrink, shrinkB=shrink, clip_on=False))
-    arrowprops.update(dict(connectionstyle=f'arc3,rad={radius:g}'))
+        arrowprops['arrowstyle'] = astyle
+        arrowprops['edgecolor'] = color
+        arrowprops['mutation_scale'] = scale
+        arrowprops['linewidth'] = lw
     if 'dist' in kwargs:
         kwargs.pop('dist')
     ax.annotate(text, xy=xyto, xytext=xyfrom, arrowprops=arrowprops,
@@ -433,12 +811,14 @@ def arrow_style(namespace, name, dist=3.0, style='>', shrink=0, lw=1,
     """
     if namespace is None:
         namespace = __main__
-    if not hasattr(namespace, 'ars'):
-        setattr(namespace, 'ars', {})
+    ars = getattr(namespace, 'ars', None)
+    if ars is None:
+        ars = {}
+        namespace.ars = ars
     ad = dict(dist=dist, style=style, shrink=shrink, lw=lw, color=color,
               head_width=head_width, head_length=head_length, **kwargs)
     setattr(namespace, 'as' + name, ad)
-    getattr(namespace, 'ars')[name] = ad
+    ars[name] = ad
 
     
 def generic_arrow_styles(namespace, palette, scale=1):
@@ -488,6 +868,43 @@ def generic_arrow_styles(namespace, palette, scale=1):
                           edgecolor='none', alpha=0.6))
 
 
+@contextmanager
+def arrow_batch(ax):
+    """ Context for drawing many arrows without intermediate redraws.
+
+    In interactive mode, each arrow, line, and text added to an axes
+    requests a redraw of the figure. Within this context these requests
+    are suppressed. On leaving the context, a single redraw is requested.
+
+    Parameters
+    ----------
+    ax: matplotlib axes
+        Axes on which the arrows are drawn.
+
+    Yields
+    ------
+    ax: matplotlib axes
+        The axes.
+
+    Examples
+    --------
+    ```py
+    with arrow_batch(ax):
+        for y in np.arange(0, 1, 0.1):
+            ax.harrow(0.1, y, 0.8, 'both', 'd=%.1f')
+    ```
+    """
+    fig = ax.get_figure()
+    callback = fig.stale_callback
+    fig.stale_callback = None
+    try:
+        yield ax
+    finally:
+        fig.stale_callback = callback
+        if callback is not None and fig.stale:
+            callback(fig, True)
+
+
 def plot_arrow_styles(ax, namespace=None):
     """ Plot names and arrows of all available arrow styles.
 
@@ -505,10 +922,12 @@ def plot_arrow_styles(ax, namespace=None):
     """
     if namespace is None:
         namespace = __main__
-    for k, name in enumerate(namespace.ars):
-        ax.harrow(0.5, 0.5*k+0.5, 1.0, 'both', 'as'+name, **namespace.ars[name])
+    # fixed limits turn off autoscaling before any arrow is drawn:
     ax.set_xlim(0.0, 2.0)
-    ax.set_ylim(0.0, 0.5*k+1)
+    ax.set_ylim(0.0, 0.5*len(namespace.ars)+0.5)
+    with arrow_batch(ax):
+        for k, name in enumerate(namespace.ars):
+            ax.harrow(0.5, 0.5*k+0.5, 1.0, 'both', 'as'+name, **namespace.ars[name])
     ax.set_title('arrow styles')
 
 
@@ -519,11 +938,15 @@ def install_arrows():
     --------
     uninstall_arrows()
     """
-    if not hasattr(mpl.axes.Axes, 'harrow'):
+    if 'harrow' not in vars(mpl.axes.Axes):
         mpl.axes.Axes.harrow = harrow
-    if not hasattr(mpl.axes.Axes, 'varrow'):
+    if 'varrow' not in vars(mpl.axes.Axes):
         mpl.axes.Axes.varrow = varrow
-    if not hasattr(mpl.axes.Axes, 'point_to'):
+    if 'harrows' not in vars(mpl.axes.Axes):
+        mpl.axes.Axes.harrows = harrows
+    if 'varrows' not in vars(mpl.axes.Axes):
+        mpl.axes.Axes.varrows = varrows
+    if 'point_to' not in vars(mpl.axes.Axes):
         mpl.axes.Axes.point_to = point_to
 
 
@@ -534,11 +957,15 @@ def uninstall_arrows():
     --------
     install_arrows()
     """
-    if hasattr(mpl.axes.Axes, 'harrow'):
+    if 'harrow' in vars(mpl.axes.Axes):
         delattr(mpl.axes.Axes, 'harrow')
-    if hasattr(mpl.axes.Axes, 'varrow'):
+    if 'varrow' in vars(mpl.axes.Axes):
         delattr(mpl.axes.Axes, 'varrow')
-    if hasattr(mpl.axes.Axes, 'point_to'):
+    if 'harrows' in vars(mpl.axes.Axes):
+        delattr(mpl.axes.Axes, 'harrows')
+    if 'varrows' in vars(mpl.axes.Axes):
+        delattr(mpl.axes.Axes, 'varrows')
+    if 'point_to' in vars(mpl.axes.Axes):
         delattr(mpl.axes.Axes, 'point_to')
 
 
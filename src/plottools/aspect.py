@@ -18,7 +18,6 @@ module, `install_aspect()` is called automatically.
 - `uninstall_aspect()`: uninstall all code of the aspect module from matplotlib.
 """
 
-import numpy as np
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 
@@ -71,8 +70,9 @@ def set_xlim_equal(ax, xmin_frac=0.0, xmax_frac=1.0):
     --------
     set_ylim_equal(), aspect_ratio()
     """
-    yrange = np.diff(ax.get_ylim())[0]
-    xrange = yrange/(xmax_frac-xmin_frac)/ax.aspect_ratio()
+    ymin, ymax = ax.get_ylim()
+    yrange = ymax - ymin
+    xrange = yrange/(xmax_frac-xmin_frac)/aspect_ratio(ax)
     ax.set_xlim(xmin_frac*xrange, xmax_frac*xrange)
 
 
@@ -106,8 +106,9 @@ def set_ylim_equal(ax, ymin_frac=0.0, ymax_frac=1.0):
     --------
     set_xlim_equal(), aspect_ratio()
     """
-    xrange = np.diff(ax.get_xlim())[0]
-    yrange = ax.aspect_ratio()*xrange/(ymax_frac-ymin_frac)
+    xmin, xmax = ax.get_xlim()
+    xrange = xmax - xmin
+    yrange = aspect_ratio(ax)*xrange/(ymax_frac-ymin_frac)
     ax.set_ylim(ymin_frac*yrange, ymax_frac*yrange)
 
 
@@ -118,11 +119,11 @@ def install_aspect():
     --------
     uninstall_aspect()
     """
-    if not hasattr(mpl.axes.Axes, 'aspect_ratio'):
+    if 'aspect_ratio' not in vars(mpl.axes.Axes):
         mpl.axes.Axes.aspect_ratio = aspect_ratio
-    if not hasattr(mpl.axes.Axes, 'set_xlim_equal'):
+    if 'set_xlim_equal' not in vars(mpl.axes.Axes):
         mpl.axes.Axes.set_xlim_equal = set_xlim_equal
-    if not hasattr(mpl.axes.Axes, 'set_ylim_equal'):
+    if 'set_ylim_equal' not in vars(mpl.axes.Axes):
         mpl.axes.Axes.set_ylim_equal = set_ylim_equal
 
 
@@ -133,11 +134,11 @@ def uninstall_aspect():
     --------
     install_aspect()
     """
-    if hasattr(mpl.axes.Axes, 'aspect_ratio'):
+    if 'aspect_ratio' in vars(mpl.axes.Axes):
         delattr(mpl.axes.Axes, 'aspect_ratio')
-    if hasattr(mpl.axes.Axes, 'set_xlim_equal'):
+    if 'set_xlim_equal' in vars(mpl.axes.Axes):
         delattr(mpl.axes.Axes, 'set_xlim_equal')
-    if hasattr(mpl.axes.Axes, 'set_ylim_equal'):
+    if 'set_ylim_equal' in vars(mpl.axes.Axes):
         delattr(mpl.axes.Axes, 'set_ylim_equal')
 
 
@@ -60,6 +60,7 @@ import matplotlib.transforms as mpt
 import matplotlib.rcsetup as mrc
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle, Circle, Polygon
+from matplotlib.collections import LineCollection
 from .rcsetup import _validate_fontdict
 
 
@@ -211,6 +212,66 @@ class Pos(tuple):
         return Pos(self[0] + delta*mpl.rcParams['circuits.scale'], self[1])
 
 
+def _element_params(lw, color, zorder, kwargs,
+                    lw_key='circuits.linewidth'):
+    """ Complete drawing parameters of a circuit element by rcParams settings.
+
+    Parameters
+    ----------
+    lw: float, int, or None
+        Linewidth. If None, use `lw_key` rcParams settings.
+    color: matplotlib color or None
+        Color. If None, use `circuits.color` rcParams settings.
+    zorder: int or None
+        zorder. If None, use `circuits.zorder` rcParams settings.
+    kwargs: dict
+        Key-word arguments for `ax.text()`.
+        Missing ones are taken from `circuits.font` rcParams settings.
+    lw_key: string
+        rcParams key of the default linewidth.
+
+    Returns
+    -------
+    lw: float, int
+        Linewidth.
+    color: matplotlib color
+        Color.
+    zorder: int
+        zorder.
+    kwargs: dict
+        Key-word arguments for `ax.text()`.
+    """
+    rc = mpl.rcParams
+    if lw is None:
+        lw = rc[lw_key]
+    if color is None:
+        color = rc['circuits.color']
+    if zorder is None:
+        zorder = rc['circuits.zorder']
+    return lw, color, zorder, dict(rc['circuits.font'], **kwargs)
+
+
+def _line_segments(ax, segments, lw, color, zorder):
+    """ Draw line segments of a circuit element as a single collection.
+
+    Parameters
+    ----------
+    ax: matplotlib axes
+        Axes where to draw the line segments.
+    segments: list of pairs of 2-tuples
+        Start and end point of each line segment in data coordinates.
+    lw: float, int
+        Linewidth of the line segments.
+    color: matplotlib color
+        Color of the line segments.
+    zorder: int
+        zorder of the line segments.
+    """
+    capstyle = mpl.rcParams['lines.solid_capstyle']
+    ax.add_collection(LineCollection(segments, linewidths=lw, colors=[color],
+                                     capstyle=capstyle, zorder=zorder))
+
+
 def resistance_h(ax, pos, label='', align='above', lw=None,
                  color=None, facecolor=None, alpha=None, zorder=None,
                  **kwargs):
@@ -257,28 +318,17 @@ def resistance_h(ax, pos, label='', align='above', lw=None,
     ValueError:
         Invalid value for `align`.
     """
-    if lw is None:
-        lw = mpl.rcParams['circuits.linewidth']
-    if color is None:
-        color = mpl.rcParams['circuits.color']
     if facecolor is None:
         facecolor = mpl.rcParams['circuits.facecolor']
     if alpha is None:
         alpha = mpl.rcParams['circuits.alpha']
-    if zorder is None:
-        zorder = mpl.rcParams['circuits.zorder']
-    for k in mpl.rcParams['circuits.font']:
-        if not k in kwargs:
-            kwargs[k] = mpl.rcParams['circuits.font'][k]
+    lw, color, zorder, kwargs = _element_params(lw, color, zorder, kwargs)
     w = mpl.rcParams['circuits.scale']
     h = 0.5*mpl.rcParams['circuits.scale']
     x, y = pos
     ax.add_patch(Rectangle((x - 0.5*w, y - 0.5*h), w, h,
-                           zorder=zorder, edgecolor='none',
-                           facecolor=facecolor, alpha=alpha))
-    ax.add_patch(Rectangle((x - 0.5*w, y - 0.5*h), w, h,
-                           zorder=zorder+1, edgecolor=color,
-                           facecolor='none', lw=lw))
+                           zorder=zorder+1, edgecolor=color, lw=lw,
+                           facecolor=mpl.colors.to_rgba(facecolor, alpha)))
     if label:
         ha = 'center'
         va = 'center'
@@ -345,28 +395,17 @@ def resistance_v(ax, pos, label='', align='right', lw=None, color=None,
     ValueError:
         Invalid value for `align`.
     """
-    if lw is None:
-        lw = mpl.rcParams['circuits.linewidth']
-    if color is None:
-        color = mpl.rcParams['circuits.color']
     if facecolor is None:
         facecolor = mpl.rcParams['circuits.facecolor']
     if alpha is None:
         alpha = mpl.rcParams['circuits.alpha']
-    if zorder is None:
-        zorder = mpl.rcParams['circuits.zorder']
-    for k in mpl.rcParams['circuits.font']:
-        if not k in kwargs:
-            kwargs[k] = mpl.rcParams['circuits.font'][k]
+    lw, color, zorder, kwargs = _element_params(lw, color, zorder, kwargs)
     w = 0.5*mpl.rcParams['circuits.scale']
     h = mpl.rcParams['circuits.scale']
     x, y = pos
     ax.add_patch(Rectangle((x - 0.5*w, y - 0.5*h), w, h,
-                           zorder=zorder, edgecolor='none',
-                           facecolor=facecolor, alpha=alpha))
-    ax.add_patch(Rectangle((x - 0.5*w, y - 0.5*h), w, h,
-                           zorder=zorder+1, edgecolor=color,
-                           facecolor='none', lw=lw))
+                           zorder=zorder+1, edgecolor=color, lw=lw,
+                           facecolor=mpl.colors.to_rgba(facecolor, alpha)))
     if label:
         ha = 'center'
         va = 'center'
@@ -437,38 +476,28 @@ def resistance(ax, pos, angle=0, label='', align='above', lw=None,
     ValueError:
         Invalid value for `align`.
     """
-    if lw is None:
-        lw = mpl.rcParams['circuits.linewidth']
-    if color is None:
-        color = mpl.rcParams['circuits.color']
     if facecolor is None:
         facecolor = mpl.rcParams['circuits.facecolor']
     if alpha is None:
         alpha = mpl.rcParams['circuits.alpha']
-    if zorder is None:
-        zorder = mpl.rcParams['circuits.zorder']
-    for k in mpl.rcParams['circuits.font']:
-        if not k in kwargs:
-            kwargs[k] = mpl.rcParams['circuits.font'][k]
+    lw, color, zorder, kwargs = _element_params(lw, color, zorder, kwargs)
     w = mpl.rcParams['circuits.scale']
     h = 0.5*mpl.rcParams['circuits.scale']
     x, y = pos
+    cosa = np.cos(np.radians(angle))
+    sina = np.sin(np.radians(angle))
     transform = mpt.Affine2D().rotate(np.radians(angle)).translate(*pos)
     ax.add_patch(Rectangle((-0.5*w, -0.5*h), w, h,
                            transform=transform + ax.transData,
-                           zorder=zorder, edgecolor='none',
-                           facecolor=facecolor, alpha=alpha))
-    ax.add_patch(Rectangle((-0.5*w, -0.5*h), w, h,
-                           transform=transform + ax.transData,
-                           zorder=zorder+1, edgecolor=color,
-                           facecolor='none', lw=lw))
+                           zorder=zorder+1, edgecolor=color, lw=lw,
+                           facecolor=mpl.colors.to_rgba(facecolor, alpha)))
     if label:
         if angle < 0:
             angle += 360
         ha = 'center'
         va = 'center'
         if align == 'above' or align == 'top':
-            pos = np.array(((0, 0.8*h),))
+            yy = 0.8*h
             if angle > 45 and angle < 45 + 90:
                 ha = 'right'
             elif angle > 45 + 180 and angle < 45 + 270:
@@ -478,7 +507,7 @@ def resistance(ax, pos, angle=0, label='', align='above', lw=None,
             elif angle > 45 + 90 and angle < 45 + 180:
                 va = 'top'
         elif align == 'below' or align == 'bottom':
-            pos = np.array(((0, -0.8*h),))
+            yy = -0.8*h
             if angle > 45 and angle < 45 + 90:
                 ha = 'left'
             elif angle > 45 + 180 and angle < 45 + 270:
@@ -488,18 +517,15 @@ def resistance(ax, pos, angle=0, label='', align='above', lw=None,
             elif angle > 45 + 90 and angle < 45 + 180:
                 va = 'bottom'
         elif align == 'center':
-            pos = np.array(((0, 0),))
+            yy = 0
         else:
             raise ValueError('align must be one of "above", "bottom", or "center"')
-        pos = transform.transform(pos)
         if not 'ha' in kwargs and not 'horizontalalignment' in kwargs:
             kwargs['ha'] = ha
         if not 'va' in kwargs and not 'verticalalignment' in kwargs:
             kwargs['va'] = va
-        ax.text(pos[0,0], pos[0,1], label, zorder=zorder+1, **kwargs)
-    nodes = np.array(((-0.5*w, 0), (+0.5*w, 0)))
-    nodes = transform.transform(nodes)
-    return Pos(*nodes[0,:]),  Pos(*nodes[1,:])
+        ax.text(x - sina*yy, y + cosa*yy, label, zorder=zorder+1, **kwargs)
+    return Pos(x - 0.5*w*cosa, y - 0.5*w*sina), Pos(x + 0.5*w*cosa, y + 0.5*w*sina)
 
 
 def capacitance_h(ax, pos, label='', align='above', lw=None,
@@ -541,22 +567,13 @@ def capacitance_h(ax, pos, label='', align='above', lw=None,
     ValueError:
         Invalid value for `align`.
     """
-    if lw is None:
-        lw = mpl.rcParams['circuits.linewidth']
-    if color is None:
-        color = mpl.rcParams['circuits.color']
-    if zorder is None:
-        zorder = mpl.rcParams['circuits.zorder']
-    for k in mpl.rcParams['circuits.font']:
-        if not k in kwargs:
-            kwargs[k] = mpl.rcParams['circuits.font'][k]
+    lw, color, zorder, kwargs = _element_params(lw, color, zorder, kwargs)
     w = mpl.rcParams['circuits.scale']
     h = mpl.rcParams['circuits.scale']*0.8/3
     x, y = pos
-    ax.plot([x - 0.5*h, x - 0.5*h], [y - 0.5*w, y + 0.5*w],
-            zorder=zorder, lw=lw, color=color)
-    ax.plot([x + 0.5*h, x + 0.5*h], [y - 0.5*w, y + 0.5*w],
-            zorder=zorder, lw=lw, color=color)
+    segments = [((x - 0.5*h, y - 0.5*w), (x - 0.5*h, y + 0.5*w)),
+                ((x + 0.5*h, y - 0.5*w), (x + 0.5*h, y + 0.5*w))]
+    _line_segments(ax, segments, lw, color, zorder)
     if label:
         yy = 0
         ha = 'center'
@@ -616,22 +633,13 @@ def capacitance_v(ax, pos, label='', align='right', lw=None,
     ValueError:
         Invalid value for `align`.
     """
-    if lw is None:
-        lw = mpl.rcParams['circuits.linewidth']
-    if color is None:
-        color = mpl.rcParams['circuits.color']
-    if zorder is None:
-        zorder = mpl.rcParams['circuits.zorder']
-    for k in mpl.rcParams['circuits.font']:
-        if not k in kwargs:
-            kwargs[k] = mpl.rcParams['circuits.font'][k]
+    lw, color, zorder, kwargs = _element_params(lw, color, zorder, kwargs)
     w = mpl.rcParams['circuits.scale']
     h = mpl.rcParams['circuits.scale']*0.8/3
     x, y = pos
-    ax.plot([x - 0.5*w, x + 0.5*w], [y + 0.5*h, y + 0.5*h],
-            zorder=zorder, lw=lw, color=color)
-    ax.plot([x - 0.5*w, x + 0.5*w], [y - 0.5*h, y - 0.5*h],
-            zorder=zorder, lw=lw, color=color)
+    segments = [((x - 0.5*w, y + 0.5*h), (x + 0.5*w, y + 0.5*h)),
+                ((x - 0.5*w, y - 0.5*h), (x + 0.5*w, y - 0.5*h))]
+    _line_segments(ax, segments, lw, color, zorder)
     if label:
         ha = 'center'
         va = 'center'
@@ -690,22 +698,13 @@ def battery_h(ax, pos, label='', align='above', lw=None, color=None,
     ValueError:
         Invalid value for `align`.
     """
-    if lw is None:
-        lw = mpl.rcParams['circuits.linewidth']
-    if color is None:
-        color = mpl.rcParams['circuits.color']
-    if zorder is None:
-        zorder = mpl.rcParams['circuits.zorder']
-    for k in mpl.rcParams['circuits.font']:
-        if not k in kwargs:
-            kwargs[k] = mpl.rcParams['circuits.font'][k]
+    lw, color, zorder, kwargs = _element_params(lw, color, zorder, kwargs)
     w = mpl.rcParams['circuits.scale']*4/3
     h = mpl.rcParams['circuits.scale']*0.8/3
     x, y = pos
-    ax.plot([x - 0.5*h, x - 0.5*h], [y - 0.5*w, y + 0.5*w],
-            zorder=zorder, lw=lw, color=color)
-    ax.plot([x + 0.5*h, x + 0.5*h], [y - 0.25*w, y + 0.25*w],
-            zorder=zorder, lw=lw, color=color)
+    segments = [((x - 0.5*h, y - 0.5*w), (x - 0.5*h, y + 0.5*w)),
+                ((x + 0.5*h, y - 0.25*w), (x + 0.5*h, y + 0.25*w))]
+    _line_segments(ax, segments, lw, color, zorder)
     if label:
         yy = 0
         ha = 'center'
@@ -765,22 +764,13 @@ def battery_v(ax, pos, label='', align='right', lw=None, color=None,
     ValueError:
         Invalid value for `align`.
     """
-    if lw is None:
-        lw = mpl.rcParams['circuits.linewidth']
-    if color is None:
-        color = mpl.rcParams['circuits.color']
-    if zorder is None:
-        zorder = mpl.rcParams['circuits.zorder']
-    for k in mpl.rcParams['circuits.font']:
-        if not k in kwargs:
-            kwargs[k] = mpl.rcParams['circuits.font'][k]
+    lw, color, zorder, kwargs = _element_params(lw, color, zorder, kwargs)
     w = mpl.rcParams['circuits.scale']*4/3
     h = mpl.rcParams['circuits.scale']*0.8/3
     x, y = pos
-    ax.plot([x - 0.5*w, x + 0.5*w], [y + 0.5*h, y + 0.5*h],
-            zorder=zorder, lw=lw, color=color)
-    ax.plot([x - 0.25*w, x + 0.25*w], [y - 0.5*h, y - 0.5*h],
-            zorder=zorder, lw=lw, color=color)
+    segments = [((x - 0.5*w, y + 0.5*h), (x + 0.5*w, y + 0.5*h)),
+                ((x - 0.25*w, y - 0.5*h), (x + 0.25*w, y - 0.5*h))]
+    _line_segments(ax, segments, lw, color, zorder)
     if label:
         ha = 'center'
         va = 'center'
@@ -837,26 +827,16 @@ def ground(ax, pos, label='', align='right', lw=None, color=None,
     ValueError:
         Invalid value for `align`.
     """
-    if lw is None:
-        lw = mpl.rcParams['circuits.linewidth']
-    if color is None:
-        color = mpl.rcParams['circuits.color']
-    if zorder is None:
-        zorder = mpl.rcParams['circuits.zorder']
-    for k in mpl.rcParams['circuits.font']:
-        if not k in kwargs:
-            kwargs[k] = mpl.rcParams['circuits.font'][k]
+    lw, color, zorder, kwargs = _element_params(lw, color, zorder, kwargs)
     w = mpl.rcParams['circuits.scale']*0.8
     h = mpl.rcParams['circuits.scale']*0.17
     w *= 0.5
     h *= 0.5
     x, y = pos
-    ax.plot([x - 0.5*w, x + 0.5*w], [y + h, y + h],
-            zorder=zorder, lw=lw, color=color)
-    ax.plot([x - 0.3*w, x + 0.3*w], [y, y],
-            zorder=zorder, lw=lw, color=color)
-    ax.plot([x - 0.06*w, x + 0.06*w], [y - h, y - h],
-            zorder=zorder, lw=lw, color=color)
+    segments = [((x - 0.5*w, y + h), (x + 0.5*w, y + h)),
+                ((x - 0.3*w, y), (x + 0.3*w, y)),
+                ((x - 0.06*w, y - h), (x + 0.06*w, y - h))]
+    _line_segments(ax, segments, lw, color, zorder)
     if label:
         ha = 'center'
         va = 'center'
@@ -913,26 +893,16 @@ def ground_u(ax, pos, label='', align='right', lw=None, color=None,
     ValueError:
         Invalid value for `align`.
     """
-    if lw is None:
-        lw = mpl.rcParams['circuits.linewidth']
-    if color is None:
-        color = mpl.rcParams['circuits.color']
-    if zorder is None:
-        zorder = mpl.rcParams['circuits.zorder']
-    for k in mpl.rcParams['circuits.font']:
-        if not k in kwargs:
-            kwargs[k] = mpl.rcParams['circuits.font'][k]
+    lw, color, zorder, kwargs = _element_params(lw, color, zorder, kwargs)
     w = mpl.rcParams['circuits.scale']*0.8
     h = mpl.rcParams['circuits.scale']*0.17
     w *= 0.5
     h *= 0.5
     x, y = pos
-    ax.plot([x - 0.5*w, x + 0.5*w], [y - h, y - h],
-            zorder=zorder, lw=lw, color=color)
-    ax.plot([x - 0.3*w, x + 0.3*w], [y, y],
-            zorder=zorder, lw=lw, color=color)
-    ax.plot([x - 0.06*w, x + 0.06*w], [y + h, y + h],
-            zorder=zorder, lw=lw, color=color)
+    segments = [((x - 0.5*w, y - h), (x + 0.5*w, y - h)),
+                ((x - 0.3*w, y), (x + 0.3*w, y)),
+                ((x - 0.06*w, y + h), (x + 0.06*w, y + h))]
+    _line_segments(ax, segments, lw, color, zorder)
     if label:
         ha = 'center'
         va = 'center'
@@ -1003,19 +973,11 @@ def opamp_l(ax, pos, label='', align='above', lw=None, color=None,
     ValueError:
         Invalid value for `align`.
     """
-    if lw is None:
-        lw = mpl.rcParams['circuits.linewidth']
-    if color is None:
-        color = mpl.rcParams['circuits.color']
     if facecolor is None:
         facecolor = mpl.rcParams['circuits.facecolor']
     if alpha is None:
         alpha = mpl.rcParams['circuits.alpha']
-    if zorder is None:
-        zorder = mpl.rcParams['circuits.zorder']
-    for k in mpl.rcParams['circuits.font']:
-        if not k in kwargs:
-            kwargs[k] = mpl.rcParams['circuits.font'][k]
+    lw, color, zorder, kwargs = _element_params(lw, color, zorder, kwargs)
     a = mpl.rcParams['circuits.scale']*5/3
     r = a/2/np.sqrt(3)
     x, y = pos
@@ -1102,19 +1064,11 @@ def opamp_r(ax, pos, label='', align='above', lw=None, color=None,
     ValueError:
         Invalid value for `align`.
     """
-    if lw is None:
-        lw = mpl.rcParams['circuits.linewidth']
-    if color is None:
-        color = mpl.rcParams['circuits.color']
     if facecolor is None:
         facecolor = mpl.rcParams['circuits.facecolor']
     if alpha is None:
         alpha = mpl.rcParams['circuits.alpha']
-    if zorder is None:
-        zorder = mpl.rcParams['circuits.zorder']
-    for k in mpl.rcParams['circuits.font']:
-        if not k in kwargs:
-            kwargs[k] = mpl.rcParams['circuits.font'][k]
+    lw, color, zorder, kwargs = _element_params(lw, color, zorder, kwargs)
     a = mpl.rcParams['circuits.scale']*5/3
     r = a/2/np.sqrt(3)
     x, y = pos
@@ -1189,15 +1143,8 @@ def switch_h(ax, pos, label='', align='above', lw=None, color=None,
     ValueError:
         Invalid value for `align`.
     """
-    if lw is None:
-        lw = mpl.rcParams['circuits.connectwidth']
-    if color is None:
-        color = mpl.rcParams['circuits.color']
-    if zorder is None:
-        zorder = mpl.rcParams['circuits.zorder']
-    for k in mpl.rcParams['circuits.font']:
-        if not k in kwargs:
-            kwargs[k] = mpl.rcParams['circuits.font'][k]
+    lw, color, zorder, kwargs = _element_params(lw, color, zorder, kwargs,
+                                                'circuits.connectwidth')
     w = mpl.rcParams['circuits.scale']
     h = 0.5*mpl.rcParams['circuits.scale']
     x, y = pos
@@ -1261,15 +1208,8 @@ def switch_v(ax, pos, label='', align='right', lw=None, color=None,
     ValueError:
         Invalid value for `align`.
     """
-    if lw is None:
-        lw = mpl.rcParams['circuits.connectwidth']
-    if color is None:
-        color = mpl.rcParams['circuits.color']
-    if zorder is None:
-        zorder = mpl.rcParams['circuits.zorder']
-    for k in mpl.rcParams['circuits.font']:
-        if not k in kwargs:
-            kwargs[k] = mpl.rcParams['circuits.font'][k]
+    lw, color, zorder, kwargs = _element_params(lw, color, zorder, kwargs,
+                                                'circuits.connectwidth')
     w = 0.5*mpl.rcParams['circuits.scale']
     h = mpl.rcParams['circuits.scale']
     x, y = pos
@@ -1326,9 +1266,7 @@ def node(ax, pos, label='', align='northeast', color=None,
         color = mpl.rcParams['circuits.color']
     if zorder is None:
         zorder = mpl.rcParams['circuits.zorder']
-    for k in mpl.rcParams['circuits.font']:
-        if not k in kwargs:
-            kwargs[k] = mpl.rcParams['circuits.font'][k]
+    kwargs = dict(mpl.rcParams['circuits.font'], **kwargs)
     r = mpl.rcParams['circuits.scale']*0.25/3
     ax.add_patch(Circle(pos, r, zorder=zorder, edgecolor='none',
                         facecolor=color))
@@ -1395,19 +1333,13 @@ def pin(ax, pos, label='', align='northeast', lw=None, color=None,
     pos: Pos
         Coordinates of the pin hole.
     """
-    if lw is None:
-        lw = mpl.rcParams['circuits.linewidth']
-    if color is None:
-        color = mpl.rcParams['circuits.color']
     if facecolor is None:
         facecolor = mpl.rcParams['circuits.facecolor']
     if alpha is None:
         alpha = mpl.rcParams['circuits.alpha']
     if zorder is None:
         zorder = mpl.rcParams['circuits.zorder'] + 1
-    for k in mpl.rcParams['circuits.font']:
-        if not k in kwargs:
-            kwargs[k] = mpl.rcParams['circuits.font'][k]
+    lw, color, zorder, kwargs = _element_params(lw, color, zorder, kwargs)
     r = mpl.rcParams['circuits.scale']*0.25/2
     ax.add_patch(Circle(pos, r, zorder=zorder, edgecolor='none',
                         facecolor=facecolor, alpha=alpha))
@@ -27,23 +27,26 @@ import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
 
 
-def common_xlabels(fig, *axes):
-    """ Reduce common xlabels.
+def _common_labels(fig, axes, axis, hide=None):
+    """ Reduce common labels of the x- or y-axis.
 
-    Remove all xlabels except for one that is centered at the bottommost axes.
+    Shared implementation of the `common_*()` functions.
 
     Parameters
     ----------
     fig: matplotlib figure
         The figure containing the axes.
-    axes: Sequence of matplotlib axes
-        Axes whose xlabels should be merged.
-        If not specified, take all axes of the figure.
+    axes: sequence of matplotlib axes
+        Axes, lists or arrays of axes whose labels should be merged.
+        If empty, take all axes of the figure.
+    axis: 'x' or 'y'
+        The axis whose labels are reduced.
+    hide: None, 'ticks', or 'spines'
+        In addition to the labels, also remove tick labels ('ticks'),
+        or ticks and spines ('spines') from all but the outermost axes.
     """
     if len(axes) == 0:
         axes = fig.get_axes()
-    if len(axes) == 0:
-        return
     axs = []
     for ax in axes:
         if isinstance(ax, np.ndarray):
@@ -53,28 +56,69 @@ def common_xlabels(fig, *axes):
         else:
             axs.append(ax)
     axes = axs
-    coords = np.array([ax.get_position().get_points().ravel() for ax in axes])
-    minx = np.min(coords[:,0])
-    maxx = np.max(coords[:,2])
-    miny = np.min(coords[:,1])
-    maxy = np.min(coords[:,3])
-    xl = 0.5*(minx+maxx)
-    if axes[0].xaxis.get_label().get_position()[0] == 1:
-        xl = maxx
-    pos = axes[0].xaxis.get_label_position()
-    done = False
-    for ax in axes:
-        first = ax.get_position().y0 < miny + 1e-6 if pos == 'bottom' else \
-            ax.get_position().y1 > maxy - 1e-6
-        if not first:
-            ax.xaxis.label.set_visible(False)
-        elif done:
-            ax.xaxis.label.set_visible(False)
+    if len(axes) < 2:
+        # nothing to reduce:
+        return
+    axis_list = [ax.xaxis if axis == 'x' else ax.yaxis for ax in axes]
+    positions = [ax.get_position() for ax in axes]
+    pos = axis_list[0].get_label_position()
+    if axis == 'x':
+        minx = min(p.x0 for p in positions)
+        maxx = max(p.x1 for p in positions)
+        xl = 0.5*(minx+maxx)
+        if axis_list[0].get_label().get_position()[0] == 1:
+            xl = maxx
+        if pos == 'bottom':
+            miny = min(p.y0 for p in positions)
+            first = [p.y0 < miny + 1e-6 for p in positions]
         else:
-            x, y = ax.xaxis.get_label().get_position()
-            x = ax.transAxes.inverted().transform(fig.transFigure.transform((xl, 0)))[0]
-            ax.xaxis.get_label().set_position((x, y))
-            done = True
+            maxy = max(p.y1 for p in positions)
+            first = [p.y1 > maxy - 1e-6 for p in positions]
+    else:
+        miny = min(p.y0 for p in positions)
+        maxy = max(p.y1 for p in positions)
+        yl = 0.5*(miny+maxy)
+        if pos == 'left':
+            minx = min(p.x0 for p in positions)
+            first = [p.x0 < minx + 1e-6 for p in positions]
+        else:
+            maxx = max(p.x1 for p in positions)
+            first = [p.x1 > maxx - 1e-6 for p in positions]
+    target = first.index(True)
+    for k, (ax, ax_axis) in enumerate(zip(axes, axis_list)):
+        if k == target:
+            continue
+        ax_axis.label.set_visible(False)
+        if not first[k]:
+            if hide == 'ticks':
+                ax_axis.set_major_formatter(ticker.NullFormatter())
+            elif hide == 'spines':
+                ax_axis.set_major_locator(ticker.NullLocator())
+                ax.spines[pos].set_visible(False)
+    # position of common label in axes coordinates of the target axes:
+    label = axis_list[target].get_label()
+    x, y = label.get_position()
+    p = positions[target]
+    if axis == 'x':
+        label.set_position(((xl - p.x0)/p.width, y))
+    else:
+        label.set_position((x, (yl - p.y0)/p.height))
+
+
+def common_xlabels(fig, *axes):
+    """ Reduce common xlabels.
+
+    Remove all xlabels except for one that is centered at the bottommost axes.
+
+    Parameters
+    ----------
+    fig: matplotlib figure
+        The figure containing the axes.
+    axes: Sequence of matplotlib axes
+        Axes whose xlabels should be merged.
+        If not specified, take all axes of the figure.
+    """
+    _common_labels(fig, axes, 'x')
 
 
 def common_ylabels(fig, *axes):
@@ -90,40 +134,7 @@ def common_ylabels(fig, *axes):
         Axes whose ylabels should be merged.
         If not specified, take all axes of the figure.
     """
-    if len(axes) == 0:
-        axes = fig.get_axes()
-    if len(axes) == 0:
-        return
-    axs = []
-    for ax in axes:
-        if isinstance(ax, np.ndarray):
-            axs.extend(ax.ravel())
-        elif isinstance(ax, (tuple, list)):
-            axs.extend(ax)
-        else:
-            axs.append(ax)
-    axes = axs
-    coords = np.array([ax.get_position().get_points().ravel() for ax in axes])
-    # center common ylabel:
-    minx = np.min(coords[:,0])
-    maxx = np.max(coords[:,2])
-    miny = np.min(coords[:,1])
-    maxy = np.max(coords[:,3])
-    yl = 0.5*(miny+maxy)
-    pos = axes[0].yaxis.get_label_position()
-    done = False
-    for ax in axes:
-        first = ax.get_position().x0 < minx + 1e-6 if pos == 'left' else \
-            ax.get_position().x1 > maxx - 1e-6
-        if not first:
-            ax.yaxis.label.set_visible(False)
-        elif done:
-            ax.yaxis.label.set_visible(False)
-        else:
-            x, y = ax.yaxis.get_label().get_position()
-            y = ax.transAxes.inverted().transform(fig.transFigure.transform((0, yl)))[1]
-            ax.yaxis.get_label().set_position((x, y))
-            done = True
+    _common_labels(fig, axes, 'y')
 
 
 def common_xticks(fig, *axes):
@@ -139,42 +150,7 @@ def common_xticks(fig, *axes):
         Axes whose xticks should be combined.
         If not specified, take all axes of the figure.
     """
-    if len(axes) == 0:
-        axes = fig.get_axes()
-    if len(axes) == 0:
-        return
-    axs = []
-    for ax in axes:
-        if isinstance(ax, np.ndarray):
-            axs.extend(ax.ravel())
-        elif isinstance(ax, (tuple, list)):
-            axs.extend(ax)
-        else:
-            axs.append(ax)
-    axes = axs
-    coords = np.array([ax.get_position().get_points().ravel() for ax in axes])
-    minx = np.min(coords[:,0])
-    maxx = np.max(coords[:,2])
-    miny = np.min(coords[:,1])
-    maxy = np.min(coords[:,3])
-    xl = 0.5*(minx+maxx)
-    if axes[0].xaxis.get_label().get_position()[0] == 1:
-        xl = maxx
-    pos = axes[0].xaxis.get_label_position()
-    done = False
-    for ax in axes:
-        first = ax.get_position().y0 < miny + 1e-6 if pos == 'bottom' else \
-            ax.get_position().y1 > maxy - 1e-6
-        if not first:
-            ax.xaxis.label.set_visible(False)
-            ax.xaxis.set_major_formatter(ticker.NullFormatter())
-        elif done:
-            ax.xaxis.label.set_visible(False)
-        else:
-            x, y = ax.xaxis.get_label().get_position()
-            x = ax.transAxes.inverted().transform(fig.transFigure.transform((xl, 0)))[0]
-            ax.xaxis.get_label().set_position((x, y))
-            done = True
+    _common_labels(fig, axes, 'x', 'ticks')
 
 
 def common_yticks(fig, *axes):
@@ -190,40 +166,7 @@ def common_yticks(fig, *axes):
         Axes whose yticks should be combined.
         If not specified, take all axes of the figure.
     """
-    if len(axes) == 0:
-        axes = fig.get_axes()
-    if len(axes) == 0:
-        return
-    axs = []
-    for ax in axes:
-        if isinstance(ax, np.ndarray):
-            axs.extend(ax.ravel())
-        elif isinstance(ax, (tuple, list)):
-            axs.extend(ax)
-        else:
-            axs.append(ax)
-    axes = axs
-    coords = np.array([ax.get_position().get_points().ravel() for ax in axes])
-    minx = np.min(coords[:,0])
-    maxx = np.max(coords[:,2])
-    miny = np.min(coords[:,1])
-    maxy = np.max(coords[:,3])
-    yl = 0.5*(miny+maxy)
-    pos = axes[0].yaxis.get_label_position()
-    done = False
-    for ax in axes:
-        first = ax.get_position().x0 < minx + 1e-6 if pos == 'left' else \
-            ax.get_position().x1 > maxx - 1e-6
-        if not first:
-            ax.yaxis.label.set_visible(False)
-            ax.yaxis.set_major_formatter(ticker.NullFormatter())
-        elif done:
-            ax.yaxis.label.set_visible(False)
-        else:
-            x, y = ax.yaxis.get_label().get_position()
-            y = ax.transAxes.inverted().transform(fig.transFigure.transform((0, yl)))[1]
-            ax.yaxis.get_label().set_position((x, y))
-            done = True
+    _common_labels(fig, axes, 'y', 'ticks')
 
 
 def common_xspines(fig, *axes):
@@ -239,43 +182,7 @@ def common_xspines(fig, *axes):
         Axes whose xticks should be combined.
         If not specified, take all axes of the figure.
     """
-    if len(axes) == 0:
-        axes = fig.get_axes()
-    if len(axes) == 0:
-        return
-    axs = []
-    for ax in axes:
-        if isinstance(ax, np.ndarray):
-            axs.extend(ax.ravel())
-        elif isinstance(ax, (tuple, list)):
-            axs.extend(ax)
-        else:
-            axs.append(ax)
-    axes = axs
-    coords = np.array([ax.get_position().get_points().ravel() for ax in axes])
-    minx = np.min(coords[:,0])
-    maxx = np.max(coords[:,2])
-    miny = np.min(coords[:,1])
-    maxy = np.min(coords[:,3])
-    xl = 0.5*(minx+maxx)
-    if axes[0].xaxis.get_label().get_position()[0] == 1:
-        xl = maxx
-    pos = axes[0].xaxis.get_label_position()
-    done = False
-    for ax in axes:
-        first = ax.get_position().y0 < miny + 1e-6 if pos == 'bottom' else \
-            ax.get_position().y1 > maxy - 1e-6
-        if not first:
-            ax.xaxis.label.set_visible(False)
-            ax.xaxis.set_major_locator(ticker.NullLocator())
-            ax.spines['bottom'].set_visible(False)
-        elif done:
-            ax.xaxis.label.set_visible(False)
-        else:
-            x, y = ax.xaxis.get_label().get_position()
-            x = ax.transAxes.inverted().transform(fig.transFigure.transform((xl, 0)))[0]
-            ax.xaxis.get_label().set_position((x, y))
-            done = True
+    _common_labels(fig, axes, 'x', 'spines')
 
 
 def common_yspines(fig, *axes):
@@ -291,41 +198,7 @@ def common_yspines(fig, *axes):
         Axes whose yticks should be combined.
         If not specified, take all axes of the figure.
     """
-    if len(axes) == 0:
-        axes = fig.get_axes()
-    if len(axes) == 0:
-        return
-    axs = []
-    for ax in axes:
-        if isinstance(ax, np.ndarray):
-            axs.extend(ax.ravel())
-        elif isinstance(ax, (tuple, list)):
-            axs.extend(ax)
-        else:
-            axs.append(ax)
-    axes = axs
-    coords = np.array([ax.get_position().get_points().ravel() for ax in axes])
-    minx = np.min(coords[:,0])
-    maxx = np.max(coords[:,2])
-    miny = np.min(coords[:,1])
-    maxy = np.max(coords[:,3])
-    yl = 0.5*(miny+maxy)
-    pos = axes[0].yaxis.get_label_position()
-    done = False
-    for ax in axes:
-        first = ax.get_position().x0 < minx + 1e-6 if pos == 'left' else \
-            ax.get_position().x1 > maxx - 1e-6
-        if not first:
-            ax.yaxis.label.set_visible(False)
-            ax.yaxis.set_major_locator(ticker.NullLocator())
-            ax.spines[pos].set_visible(False)
-        elif done:
-            ax.yaxis.label.set_visible(False)
-        else:
-            x, y = ax.yaxis.get_label().get_position()
-            y = ax.transAxes.inverted().transform(fig.transFigure.transform((0, yl)))[1]
-            ax.yaxis.get_label().set_position((x, y))
-            done = True
+    _common_labels(fig, axes, 'y', 'spines')
 
 
 def install_common():
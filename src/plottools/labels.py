@@ -29,6 +29,7 @@ loading the labels module, `install_labels()` is called automatically.
 - `uninstall_labels()`: uninstall all code of the labels module from matplotlib.
 """
 
+from functools import lru_cache
 import numpy as np
 import matplotlib as mpl
 import matplotlib.pyplot as plt
@@ -59,7 +60,31 @@ def __axis_label(label, unit=None):
     if not unit:
         return label
     else:
-        return mpl.rcParams['axes.label.format'].format(label=label, unit=unit)
+        return _format_label(mpl.rcParams['axes.label.format'], label, unit)
+
+
+@lru_cache(maxsize=256)
+def _format_label(labelformat, label, unit):
+    """ Format an axis label from a format string, a label and a unit.
+
+    Repeated labels, as in grids of subplots sharing their units,
+    are taken from the cache.
+
+    Parameters
+    ----------
+    labelformat: string
+        Format string with `label` and `unit` fields.
+    label: string
+        The name of the axis.
+    unit: string
+        The unit of the axis values.
+
+    Returns
+    -------
+    label: string
+        The formatted axis label.
+    """
+    return labelformat.format(label=label, unit=unit)
 
 
 def set_xlabel(ax, label, unit=None, **kwargs):
@@ -167,7 +167,8 @@ def neuron(ax, xy, r, label=None, xytarget=None, synapse='exc',
     if label:
         figw, _ = ax.get_figure().get_size_inches()
         pw = ax.get_position().width * figw * 72.0
-        aw = np.diff(ax.get_xlim())[0]
+        xmin, xmax = ax.get_xlim()
+        aw = xmax - xmin
         fs = 'medium'
         if 'fs' in kwargs:
             fs = kwargs.pop('fs')
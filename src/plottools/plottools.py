@@ -16,7 +16,7 @@ light_blue = pt.lighter(pt.palettes['muted']['blue'], 0.4)
 
 from .align import install_align, uninstall_align, align_params
 from .arrows import install_arrows, uninstall_arrows
-from .arrows import arrow_style, generic_arrow_styles, plot_arrow_styles
+from .arrows import arrow_style, generic_arrow_styles, plot_arrow_styles, arrow_batch
 from .aspect import install_aspect, install_aspect, uninstall_aspect
 from .axes import axes_params
 from .circuits import circuits_params, install_circuits, uninstall_circuits, Pos
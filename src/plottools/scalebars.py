@@ -146,17 +146,18 @@ def xscalebar(ax, x, y, width, wunit=None, wformat=None,
     ![xscalebar](figures/scalebars-xscalebar.png)
     """
     artists = []
-    ax.autoscale_view(False)
-    ax.autoscale(False)
+    if ax.get_autoscalex_on() or ax.get_autoscaley_on():
+        ax.autoscale_view(False)
+        ax.autoscale(False)
     # ax dimensions:
-    pixelx = np.abs(np.diff(ax.get_window_extent().get_points()[:,0]))[0]
-    pixely = np.abs(np.diff(ax.get_window_extent().get_points()[:,1]))[0]
+    pixelx = ax.bbox.width
+    pixely = ax.bbox.height
     xmin, xmax = ax.get_xlim()
     ymin, ymax = ax.get_ylim()
     unitx = xmax - xmin
     unity = ymax - ymin
-    dxu = np.abs(unitx)/pixelx
-    dyu = np.abs(unity)/pixely
+    dxu = abs(unitx)/pixelx
+    dyu = abs(unity)/pixely
     # transform x, y from relative units to axis units:
     x = xmin + x*unitx
     y = ymin + y*unity
@@ -339,17 +340,18 @@ def yscalebar(ax, x, y, height, hunit=None, hformat=None,
     ![yscalebar](figures/scalebars-yscalebar.png)
     """
     artists = []
-    ax.autoscale_view(False)
-    ax.autoscale(False)
+    if ax.get_autoscalex_on() or ax.get_autoscaley_on():
+        ax.autoscale_view(False)
+        ax.autoscale(False)
     # ax dimensions:
-    pixelx = np.abs(np.diff(ax.get_window_extent().get_points()[:,0]))[0]
-    pixely = np.abs(np.diff(ax.get_window_extent().get_points()[:,1]))[0]
+    pixelx = ax.bbox.width
+    pixely = ax.bbox.height
     xmin, xmax = ax.get_xlim()
     ymin, ymax = ax.get_ylim()
     unitx = xmax - xmin
     unity = ymax - ymin
-    dxu = np.abs(unitx)/pixelx
-    dyu = np.abs(unity)/pixely
+    dxu = abs(unitx)/pixelx
+    dyu = abs(unity)/pixely
     # transform x, y from relative units to axis units:
     x = xmin + x*unitx
     y = ymin + y*unity
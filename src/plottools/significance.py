@@ -57,8 +57,9 @@ def significance_bar(ax, p, x0, x1, y, **kwargs):
     else:
         return
     # ax dimensions:
-    pixely = np.abs(np.diff(ax.get_window_extent().get_points()[:,1]))[0]
-    unity = np.abs(np.diff(ax.get_ylim()))[0]
+    pixely = ax.bbox.height
+    ymin, ymax = ax.get_ylim()
+    unity = abs(ymax - ymin)
     dyu = unity/pixely
     fs = mpl.rcParams['font.size']
     if 'fontsize' in kwargs and isinstance(kwargs['fontsize'], (float, int)):
@@ -556,7 +556,7 @@ def __update_spines(fig):
                 if data[1] > view[1]:
                     data[1] = view[1]
                 # limit ticks to view:
-                eps = 0.001*np.diff(view)[0]
+                eps = 0.001*(view[1] - view[0])
                 locs = locs[(locs>=np.min(view)-eps)&(locs<=np.max(view)+eps)]
                 # spines bounds:
                 lower = view[0]
@@ -585,8 +585,10 @@ def __update_spines(fig):
                 _, _, w, h = ax.get_position().bounds
                 xpfac = fac/(w*figw)
                 ypfac = fac/(h*figh)
-                xdpos = lambda posx: (posx - ax.get_xlim()[0])/np.diff(ax.get_xlim())[0]
-                ydpos = lambda posy: (posy - ax.get_ylim()[0])/np.diff(ax.get_ylim())[0]
+                xmin, xmax = ax.get_xlim()
+                ymin, ymax = ax.get_ylim()
+                xdpos = lambda posx: (posx - xmin)/(xmax - xmin)
+                ydpos = lambda posy: (posy - ymin)/(ymax - ymin)
                 flush = sp.arrow['flush']
                 extend = sp.arrow['extend']
                 height = sp.arrow['height']
@@ -136,7 +136,7 @@ def __adjust_fs(fig=None, left=None, bottom=None, right=None, top=None,
     """
     if fig is None:
         fig = plt.gcf()
-    w, h = fig.get_window_extent().bounds[2:]
+    w, h = fig.bbox.size
     ppi = 72.0 # points per inch:
     fs = plt.rcParams['font.size']*fig.dpi/ppi
     if nomargins:
@@ -29,14 +29,125 @@ module, `install_tag()` is called automatically.
 - `uninstall_tag()`: uninstall all code of the tag module from matplotlib.
 """
 
+import re
+import string
 import numpy as np
+from functools import lru_cache
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 import matplotlib.rcsetup as mrc
 import matplotlib.gridspec as gridspec
+from matplotlib.font_manager import FontProperties
 from .rcsetup import _validate_fontdict
 
 
+# types of sequences of axes and labels:
+_seq_types = (list, tuple, np.ndarray)
+
+# text() arguments that are font properties and their FontProperties names:
+_font_keys = {'family': 'family', 'fontfamily': 'family',
+              'style': 'style', 'fontstyle': 'style',
+              'variant': 'variant', 'fontvariant': 'variant',
+              'weight': 'weight', 'fontweight': 'weight',
+              'stretch': 'stretch', 'fontstretch': 'stretch',
+              'size': 'size', 'fontsize': 'size'}
+
+# points per inch:
+_ppi = 72.0
+
+@lru_cache(maxsize=None)
+def _roman(n):
+    """ Roman numeral of a positive integer.
+
+    Parameters
+    ----------
+    n: int
+        A positive integer.
+
+    Returns
+    -------
+    roman: string
+        The roman numeral of `n` in upper case.
+    """
+    roman = ''
+    for value, numeral in [(1000, 'M'), (900, 'CM'), (500, 'D'), (400, 'CD'),
+                           (100, 'C'), (90, 'XC'), (50, 'L'), (40, 'XL'),
+                           (10, 'X'), (9, 'IX'), (5, 'V'), (4, 'IV'), (1, 'I')]:
+        count, n = divmod(n, value)
+        roman += count*numeral
+    return roman
+
+
+def _letter(letters, index):
+    """ Letter of a tag index.
+
+    Parameters
+    ----------
+    letters: string
+        The alphabet.
+    index: int
+        The tag index (0 = first letter).
+
+    Returns
+    -------
+    letter: string
+        The letter at `index` in `letters`.
+
+    Raises
+    ------
+    ValueError:
+        `index` is beyond the last letter.
+    """
+    if not 0 <= index < len(letters):
+        raise ValueError('tag index %d is out of range for letters %s-%s'
+                         % (index, letters[0], letters[-1]))
+    return letters[index]
+
+
+# functions generating the tag of a formatting code for a tag index:
+_tag_formats = {'a': lambda index: _letter(string.ascii_lowercase, index),
+                'A': lambda index: _letter(string.ascii_uppercase, index),
+                '1': lambda index: str(index + 1),
+                'i': lambda index: _roman(index + 1).lower(),
+                'I': lambda index: _roman(index + 1)}
+
+# formatting substrings of tag labels, major ('%A') and minor ('%mA'):
+_tag_pattern = re.compile(r'%(m?)([aA1iI])')
+
+
+def _format_tag(label, major_index, minor_index=None):
+    """ Replace formatting substrings of a tag label by indices.
+
+    Parameters
+    ----------
+    label: string
+        Label with formatting substrings '%a', '%A', '%1', '%i', '%I',
+        and their minor versions '%ma', '%mA', '%m1', '%mi', '%mI'.
+        See `tag()` for their meaning.
+    major_index: int
+        The index to be inserted for the major formatting substrings
+        (0 = 'A').
+    minor_index: int or None
+        The index to be inserted for the minor formatting substrings.
+        If None, minor formatting substrings are left untouched.
+
+    Returns
+    -------
+    label: string
+        The label with the formatting substrings replaced.
+    """
+    def replace(match):
+        if match.group(1):
+            if minor_index is None:
+                return match.group(0)
+            return _tag_formats[match.group(2)](minor_index)
+        return _tag_formats[match.group(2)](major_index)
+
+    if '%' not in label:
+        return label
+    return _tag_pattern.sub(replace, label)
+
+
 def tag(fig=None, axes=None, xoffs=None, yoffs=None,
         labels=None, minor_label=None, major_index=None,
         minor_index=None, **kwargs):
@@ -77,6 +188,8 @@ def tag(fig=None, axes=None, xoffs=None, yoffs=None,
         - '%i': i ii iii iv ...
         - '%I': I II III IV ...
         
+        Letters are available up to 'z' and 'Z', numbers and roman
+        numerals are not limited.
         Subsequent calls to `tag()` keep incrementing the label.
         With a list arbitary labels can be specified.
         If None, set to `mpl.rcParams['figure.tags.label']`.
@@ -97,22 +210,40 @@ def tag(fig=None, axes=None, xoffs=None, yoffs=None,
     kwargs: dict
         Key-word arguments are passed on to ax.text() for formatting the tag label.
         Overrides settings in `mpl.rcParams['figure.tags.font']`.
+
+    Raises
+    ------
+    ValueError:
+        More tags requested than letters available.
     """
     if fig is None:
         fig = axes[0].get_figure()
     if axes is None:
         axes = fig.get_axes()
-    if not isinstance(axes, (list, tuple, np.ndarray)):
+    if not isinstance(axes, _seq_types):
         axes = [axes]
+    nested = any(isinstance(axs, _seq_types) for axs in axes)
+    # resolve axes indices and flatten axes:
+    fig_axes = fig.get_axes()
+    if nested:
+        # canonical form: (visible axes, is minor group) per entry:
+        groups = []
+        for axs in axes:
+            minor = isinstance(axs, _seq_types)
+            if not minor:
+                axs = [axs]
+            group = [fig_axes[ax] if isinstance(ax, int) else ax for ax in axs]
+            groups.append(([ax for ax in group if ax.get_visible()], minor))
+        axes_list = [ax for group, _ in groups for ax in group]
+    else:
+        axes = [fig_axes[ax] if isinstance(ax, int) else ax for ax in axes]
+        axes_list = [ax for ax in axes if ax.get_visible()]
     if labels is None:
         labels = mpl.rcParams['figure.tags.label']
     if minor_label is None:
         minor_label = mpl.rcParams['figure.tags.minorlabel']
-    if not isinstance(labels, (list, tuple, np.ndarray)):
+    if not isinstance(labels, _seq_types):
         # generate labels:
-        romans_lower = ['i', 'ii', 'iii', 'iv', 'v', 'vi', 'vii', 'viii', 'ix', 'x',
-                        'xi', 'xii', 'xiii']
-        romans_upper = [r.upper() for r in romans_lower]
         if major_index is None:
             if hasattr(fig, 'tags_major_index'):
                 major_index = fig.tags_major_index
@@ -120,67 +251,52 @@ def tag(fig=None, axes=None, xoffs=None, yoffs=None,
                 major_index = 0
         if minor_index is None:
             minor_index = 0
-        label_list = []
-        k = 0
-        for axs in axes:
-            if isinstance(axs, (list, tuple, np.ndarray)):
-                j = 0
-                for ax in axs:
-                    if ax.get_visible():
-                        mlabel = str(minor_label) if minor_label else str(lables)
-                        mlabel = mlabel.replace('%a', chr(ord('a') + major_index + k))
-                        mlabel = mlabel.replace('%A', chr(ord('A') + major_index + k))
-                        mlabel = mlabel.replace('%1', chr(ord('1') + major_index + k))
-                        mlabel = mlabel.replace('%i', romans_lower[major_index + k])
-                        mlabel = mlabel.replace('%I', romans_upper[major_index + k]) 
-                        mlabel = mlabel.replace('%ma', chr(ord('a') + minor_index + j))
-                        mlabel = mlabel.replace('%mA', chr(ord('A') + minor_index + j))
-                        mlabel = mlabel.replace('%m1', chr(ord('1') + minor_index + j))
-                        mlabel = mlabel.replace('%mi', romans_lower[minor_index + j])
-                        mlabel = mlabel.replace('%mI', romans_upper[minor_index + j]) 
-                        label_list.append(mlabel)
-                        j += 1
-                if j > 0:
+        if nested:
+            mlabel = str(minor_label) if minor_label else str(labels)
+            label_list = []
+            k = 0
+            for group, minor in groups:
+                if not group:
+                    continue
+                if minor:
+                    label_list.extend(_format_tag(mlabel, major_index + k,
+                                                  minor_index + j)
+                                      for j in range(len(group)))
                     minor_index = 0
-                    k += 1
-            elif axs.get_visible():
-                label = labels.replace('%a', chr(ord('a') + major_index + k))
-                label = label.replace('%A', chr(ord('A') + major_index + k))
-                label = label.replace('%1', chr(ord('1') + major_index + k))
-                label = label.replace('%i', romans_lower[major_index + k])
-                label = label.replace('%I', romans_upper[major_index + k]) 
-                label_list.append(label)
+                else:
+                    label_list.append(_format_tag(labels, major_index + k))
                 k += 1
+        else:
+            k = len(axes_list)
+            tag_format = None
+            if len(labels) == 2 and labels[0] == '%':
+                tag_format = _tag_formats.get(labels[1])
+            if tag_format is not None:
+                # plain template like '%A', no substitution needed:
+                label_list = [tag_format(major_index + i) for i in range(k)]
+            else:
+                label_list = [_format_tag(labels, major_index + i)
+                              for i in range(k)]
         fig.tags_major_index = major_index + k
     else:
         label_list = labels
-    # flatten axes:
-    axes_list = []
-    for axs in axes:
-        if isinstance(axs, (list, tuple, np.ndarray)):
-            for ax in axs:
-                if ax.get_visible():
-                    axes_list.append(ax)
-        elif axs.get_visible():
-            axes_list.append(axs)
     # font settings:
-    fkwargs = dict(**mpl.rcParams['figure.tags.font'])
-    fkwargs.update(**kwargs)
-    # get axes offsets:
-    xo = -1.0
-    yo = +1.0
-    for ax, l in zip(axes_list, label_list):
-        if isinstance(ax, int):
-            ax = fig.get_axes()[ax]
-        x0, y0, width, height = ax.get_position(original=True).bounds
-        if x0 <= -xo:
-            xo = -x0
-        if 1.0 - y0 - height < yo:
-            yo = 1.0 - y0 - height
+    fkwargs = dict(mpl.rcParams['figure.tags.font'], **kwargs)
+    if 'fontproperties' not in fkwargs and 'font' not in fkwargs:
+        # shared font properties for all tags:
+        fprops = {}
+        for k in list(fkwargs):
+            if k in _font_keys:
+                fprops[_font_keys[k]] = fkwargs.pop(k)
+        if fprops:
+            fkwargs['fontproperties'] = FontProperties(**fprops)
+    # get axes positions:
+    bounds = np.array([ax.get_position(original=True).bounds
+                       for ax in axes_list]).reshape((-1, 4))
+    n = min(len(bounds), len(label_list))
     # get figure size in pixel:
-    w, h = fig.get_window_extent().bounds[2:]
-    ppi = 72.0 # points per inch:
-    fs = mpl.rcParams['font.size']*fig.dpi/ppi
+    w, h = fig.bbox.size
+    fs = mpl.rcParams['font.size']*fig.dpi/_ppi
     # compute offsets:
     if xoffs is None:
         xoffs = mpl.rcParams['figure.tags.xoffs']
@@ -190,29 +306,25 @@ def tag(fig=None, axes=None, xoffs=None, yoffs=None,
         if hasattr(fig, 'tags_xoffs'):
             xoffs = fig.tags_xoffs
         else:
-            xoffs = xo
+            xoffs = -np.min(bounds[:n,0], initial=1.0)
     else:
         xoffs *= 0.6*fs/w
     if yoffs == 'auto':
         if hasattr(fig, 'tags_yoffs'):
             yoffs = fig.tags_yoffs
         else:
+            yo = np.min(1.0 - bounds[:n,1] - bounds[:n,3], initial=1.0)
             yoffs = yo - 1.0/h   # minus one pixel
     else:
         yoffs *= fs/h
     fig.tags_xoffs = xoffs
     fig.tags_yoffs = yoffs
     # put labels onto axes:
-    for ax, l in zip(axes_list, label_list):
-        if isinstance(ax, int):
-            ax = fig.get_axes()[ax]
-        x0, y0, width, height = ax.get_position(original=True).bounds
-        x = x0 + xoffs
-        if x <= 0.0:
-            x = 0.0
-        y = y0 + height + yoffs
-        if y >= 1.0:
-            y = 1.0
+    xs = np.clip(bounds[:,0] + xoffs, 0.0, None)
+    ys = np.clip(bounds[:,1] + bounds[:,3] + yoffs, None, 1.0)
+    for ax, x, y, l in zip(axes_list, xs.tolist(), ys.tolist(), label_list):
+        if not l:
+            continue
         ax.text(x, y, l, transform=fig.transFigure, ha='left', va='top', **fkwargs)
 
 
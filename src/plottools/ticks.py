@@ -349,7 +349,7 @@ def set_xticks_fracs(ax, denominator, factor=1, fstring='', ontop=False):
         ax.xaxis.set_major_locator(ticker.FixedLocator(np.arange(0, 1.99*np.pi, factor/denominator)))
     else:
         ax.xaxis.set_major_locator(ticker.MultipleLocator(factor/denominator))
-        pixely = np.abs(np.diff(ax.get_window_extent().get_points()[:,1]))[0]
+        pixely = ax.bbox.height
         for label in ax.get_xticklabels():
             fs = label.get_fontsize()
             label.set_verticalalignment('center')